@@ -7,7 +7,8 @@ through the MCP resource protocol.
 
 import json
 import logging
-from typing import Any, Dict, List
+from collections import Counter
+from typing import Any, Dict, Final, List
 
 from fastmcp import FastMCP
 
@@ -18,6 +19,21 @@ from .utils import add_filter
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Resource URIs
+PERFORMER_ALL_URI: Final[str] = "stash://performer/all"
+PERFORMER_INFO_URI: Final[str] = "stash://performer/{name}"
+PERFORMER_COUNTRY_URI: Final[str] = "stash://performer/country/{country}"
+PERFORMER_ETHNICITY_URI: Final[str] = (
+    "stash://performer/ethnicity/{ethnicity}"
+)
+PERFORMER_STATS_URI: Final[str] = "stash://performer/stats"
+STUDIO_ALL_URI: Final[str] = "stash://studio/all"
+STUDIO_INFO_URI: Final[str] = "stash://studio/{name}"
+STUDIO_STATS_URI: Final[str] = "stash://studio/stats"
+TAG_ALL_URI: Final[str] = "stash://tag/all"
+TAG_INFO_URI: Final[str] = "stash://tag/{name}"
+TAG_STATS_URI: Final[str] = "stash://tag/stats"
+
 
 def register_resources(mcp: FastMCP) -> None:
     """Register all resources with the MCP server.
@@ -29,7 +45,7 @@ def register_resources(mcp: FastMCP) -> None:
     """
 
     @mcp.resource(
-        uri="stash://performer/all",
+        uri=PERFORMER_ALL_URI,
         name="All performers",
         description="List of all favorite performers in the Stash database"
     )
@@ -99,7 +115,7 @@ def register_resources(mcp: FastMCP) -> None:
             })
 
     @mcp.resource(
-        uri="stash://performer/{name}",
+        uri=PERFORMER_INFO_URI,
         name="Performer Information",
         description="Detailed information about a specific performer"
     )
@@ -191,7 +207,7 @@ def register_resources(mcp: FastMCP) -> None:
             })
 
     @mcp.resource(
-        uri="stash://performer/country/{country}",
+        uri=PERFORMER_COUNTRY_URI,
         name="Performers by Country",
         description="List of performers from a specific country"
     )
@@ -258,7 +274,7 @@ def register_resources(mcp: FastMCP) -> None:
             })
 
     @mcp.resource(
-        uri="stash://performer/ethnicity/{ethnicity}",
+        uri=PERFORMER_ETHNICITY_URI,
         name="Performers by Ethnicity",
         description="List of performers with a specific ethnicity"
     )
@@ -325,7 +341,7 @@ def register_resources(mcp: FastMCP) -> None:
             })
 
     @mcp.resource(
-        uri="stash://performer/stats",
+        uri=PERFORMER_STATS_URI,
         name="Performers Statistics",
         description="Statistical summary of all performers in the database"
     )
@@ -355,52 +371,34 @@ def register_resources(mcp: FastMCP) -> None:
 
             logger.info("Generated statistics for %d performers", len(performers))
 
-            # Calculate statistics
-            countries: Dict[str, int] = {}
-            ethnicities: Dict[str, int] = {}
-            heights: List[int] = []
-            weights: List[int] = []
-
-            for performer in performers:
-                country = performer.get("country")
-                if country:
-                    countries[country] = countries.get(country, 0) + 1
-
-                ethnicity = performer.get("ethnicity")
-                if ethnicity:
-                    ethnicities[ethnicity] = ethnicities.get(
-                        ethnicity, 0
-                    ) + 1
-
-                height = performer.get("height_cm")
-                if height:
-                    heights.append(height)
-
-                weight = performer.get("weight")
-                if weight:
-                    weights.append(weight)
+            # Extract each attribute in a single comprehension so counting
+            # and the sum/min/max reductions below run in C
+            countries = Counter(
+                country for performer in performers
+                if (country := performer.get("country"))
+            )
+            ethnicities = Counter(
+                ethnicity for performer in performers
+                if (ethnicity := performer.get("ethnicity"))
+            )
+            heights: List[int] = [
+                height for performer in performers
+                if (height := performer.get("height_cm"))
+            ]
+            weights: List[int] = [
+                weight for performer in performers
+                if (weight := performer.get("weight"))
+            ]
 
             # Build statistics object
             stats: Dict[str, Any] = {
                 "geographic_distribution": {
                     "total_countries": len(countries),
-                    "countries": dict(
-                        sorted(
-                            countries.items(),
-                            key=lambda x: x[1],
-                            reverse=True
-                        )[:10]
-                    )
+                    "countries": dict(countries.most_common(10))
                 },
                 "ethnic_distribution": {
                     "total_ethnicities": len(ethnicities),
-                    "ethnicities": dict(
-                        sorted(
-                            ethnicities.items(),
-                            key=lambda x: x[1],
-                            reverse=True
-                        )[:10]
-                    )
+                    "ethnicities": dict(ethnicities.most_common(10))
                 }
             }
 
@@ -445,7 +443,7 @@ def register_resources(mcp: FastMCP) -> None:
     # ========================================================================
 
     @mcp.resource(
-        uri="stash://studio/all",
+        uri=STUDIO_ALL_URI,
         name="All studios",
         description="List of all favorite studios in the Stash database"
     )
@@ -516,7 +514,7 @@ def register_resources(mcp: FastMCP) -> None:
             })
 
     @mcp.resource(
-        uri="stash://studio/{name}",
+        uri=STUDIO_INFO_URI,
         name="Studio Information",
         description="Detailed information about a specific studio"
     )
@@ -601,7 +599,7 @@ def register_resources(mcp: FastMCP) -> None:
             })
 
     @mcp.resource(
-        uri="stash://studio/stats",
+        uri=STUDIO_STATS_URI,
         name="Studios Statistics",
         description="Statistical summary of all studios in the database"
     )
@@ -631,24 +629,19 @@ def register_resources(mcp: FastMCP) -> None:
 
             logger.info("Generated statistics for %d studios", len(studios))
 
-            total_scenes = 0
-            ratings: List[int] = []
-            with_parent = 0
-            with_children = 0
-
-            for studio in studios:
-                scene_count = studio.get("scene_count", 0)
-                total_scenes += scene_count
-
-                rating = studio.get("rating100")
-                if rating:
-                    ratings.append(rating)
-
-                if studio.get("parent_studio"):
-                    with_parent += 1
-
-                if studio.get("child_studios"):
-                    with_children += 1
+            total_scenes = sum(
+                studio.get("scene_count", 0) for studio in studios
+            )
+            ratings: List[int] = [
+                rating for studio in studios
+                if (rating := studio.get("rating100"))
+            ]
+            with_parent = sum(
+                1 for studio in studios if studio.get("parent_studio")
+            )
+            with_children = sum(
+                1 for studio in studios if studio.get("child_studios")
+            )
 
             stats: Dict[str, Any] = {
                 "total_scenes": total_scenes,
@@ -685,7 +678,7 @@ def register_resources(mcp: FastMCP) -> None:
     # ========================================================================
 
     @mcp.resource(
-        uri="stash://tag/all",
+        uri=TAG_ALL_URI,
         name="All tags",
         description="List of all favorite tags in the Stash database"
     )
@@ -749,7 +742,7 @@ def register_resources(mcp: FastMCP) -> None:
             })
 
     @mcp.resource(
-        uri="stash://tag/{name}",
+        uri=TAG_INFO_URI,
         name="Tag Information",
         description="Detailed information about a specific tag"
     )
@@ -821,7 +814,7 @@ def register_resources(mcp: FastMCP) -> None:
             })
 
     @mcp.resource(
-        uri="stash://tag/stats",
+        uri=TAG_STATS_URI,
         name="Tags Statistics",
         description="Statistical summary of all tags in the database"
     )
@@ -848,25 +841,15 @@ def register_resources(mcp: FastMCP) -> None:
 
             logger.info("Generated statistics for %d tags", len(tags))
 
-            total_scenes = 0
-            total_markers = 0
-            scene_counts: List[int] = []
-            with_parents = 0
-            with_children = 0
-
-            for tag in tags:
-                scene_count = tag.get("scene_count", 0)
-                total_scenes += scene_count
-                scene_counts.append(scene_count)
-
-                marker_count = tag.get("scene_marker_count", 0)
-                total_markers += marker_count
-
-                if tag.get("parents"):
-                    with_parents += 1
-
-                if tag.get("children"):
-                    with_children += 1
+            scene_counts: List[int] = [
+                tag.get("scene_count", 0) for tag in tags
+            ]
+            total_scenes = sum(scene_counts)
+            total_markers = sum(
+                tag.get("scene_marker_count", 0) for tag in tags
+            )
+            with_parents = sum(1 for tag in tags if tag.get("parents"))
+            with_children = sum(1 for tag in tags if tag.get("children"))
 
             stats: Dict[str, Any] = {
                 "total_scene_associations": total_scenes,
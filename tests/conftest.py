@@ -4,128 +4,272 @@ This module provides reusable fixtures for testing the Stash MCP server,
 including mock Stash interfaces, sample data, and server configurations.
 """
 
-from typing import Any, Dict, List, TYPE_CHECKING
+from functools import cache, partial
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Mapping, Tuple, TYPE_CHECKING
 from unittest.mock import Mock
 
 import pytest
+import pytest_asyncio
+from fastmcp import Client
 from stashapi.stashapp import StashInterface
 
+from stash_mcp_server import resources, tools
 from stash_mcp_server.server import mcp
 
 if TYPE_CHECKING:
     from fastmcp import FastMCP
 
 
-@pytest.fixture
-def mock_stash_interface() -> Mock:
-    """Create a mock StashInterface for testing.
+# Attribute names are resolved once; a class spec would rescan StashInterface
+# (including coroutine detection) for every mock built.
+_STASH_INTERFACE_SPEC: List[str] = dir(StashInterface)
+
+ResourceFunc = Callable[..., str]
+"""Signature of a registered MCP resource function."""
+
+
+class _StubMCP:
+    """Minimal stand-in for ``FastMCP`` that records resource functions.
+
+    A plain class avoids the attribute bookkeeping ``Mock`` does on every
+    access, and registration only ever needs ``resource``.
+
+    Attributes
+    ----------
+    captured : Dict[str, ResourceFunc]
+        Registered resource functions keyed by URI.
+    """
+
+    def __init__(self) -> None:
+        self.captured: Dict[str, ResourceFunc] = {}
+
+    def resource(
+        self,
+        uri: str,
+        name: str,
+        description: str,
+    ) -> Callable[[ResourceFunc], ResourceFunc]:
+        """Return a decorator that records the function under ``uri``."""
+        return partial(self._record, uri)
+
+    def _record(self, uri: str, func: ResourceFunc) -> ResourceFunc:
+        """Store ``func`` under ``uri``, returning it unchanged."""
+        self.captured[uri] = func
+        return func
+
+
+@pytest.fixture(autouse=True)
+def _clear_tool_caches() -> None:
+    """Start every test with empty tool caches.
+
+    The ``lru_cache`` wrappers in :mod:`stash_mcp_server.tools` live for
+    the whole process; clearing them keeps tests independent of their
+    order, within a run and across xdist workers.
+    """
+    tools._cached_get_performer_info.cache_clear()
+    tools._cached_get_all_scenes.cache_clear()
+    tools._cached_get_all_performers.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def _session_stash_interface() -> Mock:
+    """Build the mocked StashInterface once per session.
 
     Returns
     -------
     Mock
         Mocked StashInterface with common methods.
     """
-    mock = Mock(spec=StashInterface)
+    mock = Mock(spec=_STASH_INTERFACE_SPEC)
     mock._server_url = "http://localhost:9999"
     return mock
 
 
 @pytest.fixture
-def sample_performer() -> Dict[str, Any]:
-    """Provide sample performer data for testing.
+def mock_stash_interface(_session_stash_interface: Mock) -> Iterator[Mock]:
+    """Provide the shared mock StashInterface, reset after each test.
 
-    Returns
-    -------
-    Dict[str, Any]
-        Sample performer dictionary with common fields.
+    Tests configure ``return_value``/``side_effect`` on its methods; the
+    reset clears those along with the recorded calls, so no test sees
+    another's setup.
+
+    Parameters
+    ----------
+    _session_stash_interface : Mock
+        Session-wide mocked StashInterface.
+
+    Yields
+    ------
+    Mock
+        Mocked StashInterface with common methods.
     """
-    return {
-        "id": "123",
-        "name": "Test Performer",
-        "country": "USA",
-        "ethnicity": "Caucasian",
-        "eye_color": "Blue",
-        "hair_color": "Blonde",
-        "height_cm": 170,
-        "weight": 65,
-        "measurements": "34-24-36",
-        "tattoos": ["arm", "back"],
-        "piercings": ["navel"],
-        "favorite": True,
-    }
+    yield _session_stash_interface
+    _session_stash_interface.reset_mock(return_value=True, side_effect=True)
 
 
 @pytest.fixture
-def sample_scene() -> Dict[str, Any]:
-    """Provide sample scene data for testing.
+def stub_stash_interface(
+    monkeypatch: pytest.MonkeyPatch,
+    mock_stash_interface: Mock,
+) -> Mock:
+    """Make the resources module use the mocked StashInterface.
+
+    The module attribute is rebound through ``monkeypatch``, which is
+    cheaper than entering a ``unittest.mock.patch`` context per test and
+    is undone automatically on teardown.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Pytest fixture used to rebind ``get_stash_interface``.
+    mock_stash_interface : Mock
+        Mocked StashInterface to return from ``get_stash_interface``.
 
     Returns
     -------
-    Dict[str, Any]
-        Sample scene dictionary with common fields.
+    Mock
+        The same mocked StashInterface.
     """
-    return {
-        "id": "456",
-        "title": "Test Scene",
-        "rating100": 85,
-        "organized": True,
-        "tags": [
-            {"id": "1", "name": "tag1"},
-            {"id": "2", "name": "tag2"},
-        ],
-        "performers": [
-            {"id": "123", "name": "Test Performer"}
-        ],
-    }
+    monkeypatch.setattr(resources, "get_stash_interface", lambda: mock_stash_interface)
+    return mock_stash_interface
 
 
 @pytest.fixture
-def sample_scenes_list(sample_scene: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Provide list of sample scenes for testing.
+def add_filter_spy(monkeypatch: pytest.MonkeyPatch) -> List[Tuple[Any, ...]]:
+    """Replace ``add_filter`` in the resources module with a recording stub.
 
     Parameters
     ----------
-    sample_scene : Dict[str, Any]
-        Base scene fixture.
+    monkeypatch : pytest.MonkeyPatch
+        Pytest fixture used to rebind ``add_filter``.
 
     Returns
     -------
-    List[Dict[str, Any]]
-        List of scene dictionaries with varied ratings.
+    List[Tuple[Any, ...]]
+        Positional arguments of every ``add_filter`` call, in order.
     """
-    scenes = []
-    for i in range(5):
-        scene = sample_scene.copy()
-        scene["id"] = str(456 + i)
-        scene["title"] = f"Test Scene {i + 1}"
-        scene["rating100"] = 60 + (i * 10)
-        scenes.append(scene)
-    return scenes
+    calls: List[Tuple[Any, ...]] = []
+    monkeypatch.setattr(resources, "add_filter", lambda *args: calls.append(args))
+    return calls
 
 
-@pytest.fixture
-def sample_performers_list(
-    sample_performer: Dict[str, Any]
-) -> List[Dict[str, Any]]:
-    """Provide list of sample performers for testing.
+_SAMPLE_PERFORMER: Mapping[str, Any] = MappingProxyType({
+    "id": "123",
+    "name": "Test Performer",
+    "country": "USA",
+    "ethnicity": "Caucasian",
+    "eye_color": "Blue",
+    "hair_color": "Blonde",
+    "height_cm": 170,
+    "weight": 65,
+    "measurements": "34-24-36",
+    "tattoos": ["arm", "back"],
+    "piercings": ["navel"],
+    "favorite": True,
+})
+
+_SAMPLE_SCENE: Mapping[str, Any] = MappingProxyType({
+    "id": "456",
+    "title": "Test Scene",
+    "rating100": 85,
+    "organized": True,
+    "tags": [
+        {"id": "1", "name": "tag1"},
+        {"id": "2", "name": "tag2"},
+    ],
+    "performers": [
+        {"id": "123", "name": "Test Performer"}
+    ],
+})
+
+# Built once at import time; fixtures hand out shallow list copies.
+_SAMPLE_SCENES: Tuple[Dict[str, Any], ...] = tuple(
+    dict(
+        _SAMPLE_SCENE,
+        id=str(456 + i),
+        title=f"Test Scene {i + 1}",
+        rating100=60 + (i * 10),
+    )
+    for i in range(5)
+)
+
+_SAMPLE_PERFORMERS: Tuple[Dict[str, Any], ...] = tuple(
+    dict(_SAMPLE_PERFORMER, id=str(123 + i), name=f"Test Performer {i + 1}")
+    for i in range(3)
+)
+
+
+@cache
+def _scenes_min_rating(threshold: int) -> Tuple[Dict[str, Any], ...]:
+    """Return the sample scenes rated at least ``threshold``.
 
     Parameters
     ----------
-    sample_performer : Dict[str, Any]
-        Base performer fixture.
+    threshold : int
+        Minimum ``rating100`` value, inclusive.
+
+    Returns
+    -------
+    Tuple[Dict[str, Any], ...]
+        Matching scenes from ``_SAMPLE_SCENES``, in order.
+    """
+    return tuple(s for s in _SAMPLE_SCENES if s["rating100"] >= threshold)
+
+
+@pytest.fixture(scope="session")
+def sample_performer() -> Mapping[str, Any]:
+    """Provide sample performer data for testing.
+
+    The data is built once per session and exposed read-only; tests that
+    need extra fields should build ``dict(sample_performer, ...)``.
+
+    Returns
+    -------
+    Mapping[str, Any]
+        Read-only sample performer mapping with common fields.
+    """
+    return _SAMPLE_PERFORMER
+
+
+@pytest.fixture(scope="session")
+def sample_scenes_list() -> Tuple[Dict[str, Any], ...]:
+    """Provide the sample scenes for testing.
+
+    The tuple is shared by the whole session, so tests must not mutate
+    it or its scenes. The scenes stay plain dicts because tool tests
+    pass them through pydantic serialization.
+
+    Returns
+    -------
+    Tuple[Dict[str, Any], ...]
+        Scene dictionaries with ratings 60 to 100.
+    """
+    return _SAMPLE_SCENES
+
+
+@pytest.fixture(scope="session")
+def scenes_min_rating() -> Callable[[int], Tuple[Dict[str, Any], ...]]:
+    """Provide the cached minimum-rating view of the sample scenes.
+
+    Returns
+    -------
+    Callable[[int], Tuple[Dict[str, Any], ...]]
+        Function returning the sample scenes rated at least a threshold.
+    """
+    return _scenes_min_rating
+
+
+@pytest.fixture(scope="session")
+def sample_performers_list() -> List[Dict[str, Any]]:
+    """Provide list of sample performers for testing.
 
     Returns
     -------
     List[Dict[str, Any]]
         List of performer dictionaries.
     """
-    performers = []
-    for i in range(3):
-        performer = sample_performer.copy()
-        performer["id"] = str(123 + i)
-        performer["name"] = f"Test Performer {i + 1}"
-        performers.append(performer)
-    return performers
+    return list(_SAMPLE_PERFORMERS)
 
 
 @pytest.fixture
@@ -138,3 +282,39 @@ def test_server() -> "FastMCP":
         The configured MCP server instance.
     """
     return mcp
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mcp_client() -> AsyncIterator[Client]:
+    """Provide one connected in-memory client for the whole session.
+
+    Opening the transport dominates the cost of a tool call test, so it
+    is done once. Tests using it must run on the session event loop.
+
+    Yields
+    ------
+    Client
+        Client connected to the MCP server.
+    """
+    async with Client(mcp) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def registered_resources() -> Mapping[str, ResourceFunc]:
+    """Capture the resource functions passed to ``mcp.resource``.
+
+    ``register_resources`` runs once against a ``_StubMCP`` whose
+    ``resource`` decorator records each undecorated function. They look
+    up the Stash interface at call time, so they can be shared by every
+    test. The mapping is read-only to keep tests from leaking state into
+    each other.
+
+    Returns
+    -------
+    Mapping[str, ResourceFunc]
+        Resource functions keyed by URI.
+    """
+    stub_mcp = _StubMCP()
+    resources.register_resources(stub_mcp)
+    return MappingProxyType(stub_mcp.captured)
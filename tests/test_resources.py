@@ -4,214 +4,209 @@ This module contains comprehensive tests for all resource functions
 that expose performer information from the Stash database.
 """
 
-import json
-from typing import Any, Callable, Dict
-from unittest.mock import Mock, patch
+from typing import Any, Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+from unittest.mock import Mock
+
+import pytest
+from orjson import loads
+
+from stash_mcp_server.resources import (
+    PERFORMER_ALL_URI,
+    PERFORMER_COUNTRY_URI,
+    PERFORMER_ETHNICITY_URI,
+    PERFORMER_INFO_URI,
+    PERFORMER_STATS_URI,
+    STUDIO_ALL_URI,
+    STUDIO_INFO_URI,
+    STUDIO_STATS_URI,
+    TAG_ALL_URI,
+    TAG_INFO_URI,
+    TAG_STATS_URI,
+)
+from stash_mcp_server.server import mcp
+
+_DB_ERR = RuntimeError('Database error')
+_API_ERR = RuntimeError('API error')
+_CONN_ERR = RuntimeError('Connection failed')
+
+_TAGS_LIST: List[Dict[str, Any]] = [
+    {
+        "id": "1",
+        "name": "Tag 1",
+        "scene_count": 10,
+        "description": "A tag",
+        "scene_marker_count": 5,
+    },
+    {
+        "id": "2",
+        "name": "Tag 2",
+        "scene_count": 8,
+    },
+]
+
+_TAG_DATA: Dict[str, Any] = {
+    "id": "1",
+    "name": "Test Tag",
+    "scene_count": 10,
+    "scene_marker_count": 5,
+    "favorite": True,
+    "description": "A test tag",
+    "aliases": "tt",
+    "parents": [{"id": "0", "name": "Parent"}],
+    "children": [{"id": "2", "name": "Child"}],
+}
+
+_TAGS_STATS: List[Dict[str, Any]] = [
+    {
+        "id": "1",
+        "name": "Tag 1",
+        "scene_count": 10,
+        "scene_marker_count": 5,
+        "parents": [{"id": "0"}],
+        "children": [{"id": "2"}],
+    },
+    {
+        "id": "2",
+        "name": "Tag 2",
+        "scene_count": 8,
+        "scene_marker_count": 3,
+        "parents": None,
+        "children": None,
+    },
+]
+
+
+# Performer payloads for the statistics tests, shared read-only.
+_STATS_ALL_FIELDS: Tuple[Dict[str, Any], ...] = (
+    {
+        'name': 'Performer 1',
+        'country': 'USA',
+        'ethnicity': 'Caucasian',
+        'height_cm': 170,
+        'weight': 65,
+    },
+    {
+        'name': 'Performer 2',
+        'country': 'USA',
+        'ethnicity': 'Asian',
+        'height_cm': 165,
+        'weight': 60,
+    },
+)
+
+_STATS_PARTIAL_FIELDS: Tuple[Dict[str, Any], ...] = (
+    {'name': 'Performer 1', 'height_cm': 170},
+    {'name': 'Performer 2', 'country': 'Canada'},
+)
+
+_STATS_ONLY_WEIGHTS: Tuple[Dict[str, Any], ...] = (
+    {'name': 'Performer 1', 'weight': 65},
+    {'name': 'Performer 2', 'weight': 60},
+)
+
+_STATS_ONLY_HEIGHTS: Tuple[Dict[str, Any], ...] = (
+    {'name': 'Performer 1', 'height_cm': 170},
+    {'name': 'Performer 2', 'height_cm': 165},
+)
+
+_STATS_NO_DEMOGRAPHICS: Tuple[Dict[str, Any], ...] = (
+    {'name': 'Performer 1'},
+    {'name': 'Performer 2'},
+)
 
-from stash_mcp_server.resources import register_resources
 
+# ============================================================================
+# Performer Resources Tests
+# ============================================================================
 
-class TestListAllPerformers:
-    """Tests for the list_all_performers resource."""
+# The all/country/ethnicity listing resources share one response shape, so
+# these cases only differ by resource URI and the positional argument passed
+# to it.
+_PERFORMER_LIST_CASES = [
+    pytest.param(PERFORMER_ALL_URI, (), id="all"),
+    pytest.param(PERFORMER_COUNTRY_URI, ('Unknown',), id="country"),
+    pytest.param(PERFORMER_ETHNICITY_URI, ('Unknown',), id="ethnicity"),
+]
+
+
+_PERFORMER_SUCCESS_CASES = [
+    pytest.param(PERFORMER_ALL_URI, (), None, id="all"),
+    pytest.param(PERFORMER_COUNTRY_URI, ('USA',), ('country', 'USA'), id="country"),
+    pytest.param(
+        PERFORMER_ETHNICITY_URI,
+        ('Asian',),
+        ('ethnicity', 'Asian'),
+        id="ethnicity",
+    ),
+]
+
+
+# Performers that only carry part of the data the statistics are built from,
+# with the expected value of one section of the statistics payload.
+_SPARSE_STATS_CASES = [
+    pytest.param(
+        _STATS_ONLY_WEIGHTS,
+        'physical_statistics',
+        {'weight': {'average_kg': 62.5, 'min_kg': 60, 'max_kg': 65, 'count': 2}},
+        id="only_weights",
+    ),
+    pytest.param(
+        _STATS_ONLY_HEIGHTS,
+        'physical_statistics',
+        {'height': {'average_cm': 167.5, 'min_cm': 165, 'max_cm': 170, 'count': 2}},
+        id="only_heights",
+    ),
+    pytest.param(
+        _STATS_NO_DEMOGRAPHICS,
+        'geographic_distribution',
+        {'total_countries': 0, 'countries': {}},
+        id="no_demographics_geographic",
+    ),
+    pytest.param(
+        _STATS_NO_DEMOGRAPHICS,
+        'ethnic_distribution',
+        {'total_ethnicities': 0, 'ethnicities': {}},
+        id="no_demographics_ethnic",
+    ),
+]
 
-    def test_list_all_performers_success(
-        self,
-        mock_stash_interface: Mock,
-        sample_performer: Dict[str, Any],
-    ) -> None:
-        """Test successful listing of all favorite performers.
 
-        Parameters
-        ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
-        sample_performer : Dict[str, Any]
-            Sample performer data.
-        """
-        # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        performers_list = [sample_performer.copy() for _ in range(3)]
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_performers.return_value = (
-                performers_list
-            )
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://performer/all']()
-
-            # Assert
-            assert mock_stash_interface.find_performers.called
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            assert result_data['total'] == 3
-            assert 'performers' in result_data
-            assert len(result_data['performers']) == 3
-
-    def test_list_all_performers_empty(
-        self,
-        mock_stash_interface: Mock,
-    ) -> None:
-        """Test listing performers when none exist.
-
-        Parameters
-        ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
-        """
-        # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_performers.return_value = []
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://performer/all']()
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            assert result_data['total'] == 0
-            assert result_data['performers'] == []
+class TestListAllPerformers:
+    """Tests for the list_all_performers resource."""
 
     def test_list_all_performers_with_full_data(
         self,
-        mock_stash_interface: Mock,
-        sample_performer: Dict[str, Any],
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
+        sample_performer: Mapping[str, Any],
     ) -> None:
         """Test listing performers with all available fields.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
-        sample_performer : Dict[str, Any]
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
+        sample_performer : Mapping[str, Any]
             Sample performer data.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        sample_performer['tags'] = [
-            {'name': 'tag1'},
-            {'name': 'tag2'},
+        stub_stash_interface.find_performers.return_value = [
+            dict(sample_performer, tags=[{'name': 'tag1'}, {'name': 'tag2'}]),
         ]
 
-        performers_list = [sample_performer]
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_performers.return_value = performers_list
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://performer/all']()
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            assert len(result_data['performers']) == 1
-            performer = result_data['performers'][0]
-            assert 'height_cm' in performer
-            assert 'weight' in performer
-            assert 'tags' in performer
-
-    def test_list_all_performers_exception(
-        self,
-        mock_stash_interface: Mock,
-    ) -> None:
-        """Test error handling when listing performers fails.
+        # Act
+        result = registered_resources[PERFORMER_ALL_URI]()
 
-        Parameters
-        ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
-        """
-        # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_performers.side_effect = (
-                Exception('Database error')
-            )
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://performer/all']()
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is False
-            assert 'error' in result_data
+        # Assert
+        result_data = loads(result)
+        assert result_data['success'] is True
+        assert len(result_data['performers']) == 1
+        performer = result_data['performers'][0]
+        assert 'height_cm' in performer
+        assert 'weight' in performer
+        assert 'tags' in performer
 
 
 class TestGetPerformersInfo:
@@ -219,557 +214,265 @@ class TestGetPerformersInfo:
 
     def test_get_performer_info_success(
         self,
-        mock_stash_interface: Mock,
-        sample_performer: Dict[str, Any],
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
+        sample_performer: Mapping[str, Any],
     ) -> None:
         """Test successful retrieval of performer info.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
-        sample_performer : Dict[str, Any]
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
+        sample_performer : Mapping[str, Any]
             Sample performer data.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_performer.return_value = (
-                sample_performer
-            )
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://performer/{name}'](
-                'Test Performer'
-            )
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            assert 'performer' in result_data
-            performer = result_data['performer']
-            assert performer['name'] == 'Test Performer'
+        stub_stash_interface.find_performer.return_value = sample_performer
+
+        # Act
+        result = registered_resources[PERFORMER_INFO_URI]('Test Performer')
+
+        # Assert
+        result_data = loads(result)
+        assert result_data['success'] is True
+        assert 'performer' in result_data
+        performer = result_data['performer']
+        assert performer['name'] == 'Test Performer'
 
     def test_get_performer_info_not_found(
         self,
-        mock_stash_interface: Mock,
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
     ) -> None:
         """Test retrieval when performer is not found.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_performer.return_value = None
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://performer/{name}']('Unknown')
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is False
-            assert 'error' in result_data
+        stub_stash_interface.find_performer.return_value = None
+
+        # Act
+        result = registered_resources[PERFORMER_INFO_URI]('Unknown')
+
+        # Assert
+        result_data = loads(result)
+        assert result_data['success'] is False
+        assert 'error' in result_data
 
     def test_get_performer_info_full_details(
         self,
-        mock_stash_interface: Mock,
-        sample_performer: Dict[str, Any],
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
+        sample_performer: Mapping[str, Any],
     ) -> None:
         """Test performer info with all optional fields.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
-        sample_performer : Dict[str, Any]
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
+        sample_performer : Mapping[str, Any]
             Sample performer data.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        sample_performer['details'] = 'Bio information'
-        sample_performer['tags'] = [{'name': 'tag1'}, {'name': 'tag2'}]
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_performer.return_value = (
-                sample_performer
-            )
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://performer/{name}']('Test')
-
-            # Assert
-            result_data = json.loads(result)
-            performer = result_data['performer']
-            assert 'bio' in performer
-            assert 'tags' in performer
-            assert 'measurements' in performer
-            assert 'physical_characteristics' in performer
+        stub_stash_interface.find_performer.return_value = dict(
+            sample_performer,
+            details='Bio information',
+            tags=[{'name': 'tag1'}, {'name': 'tag2'}],
+        )
+
+        # Act
+        result = registered_resources[PERFORMER_INFO_URI]('Test')
+
+        # Assert
+        result_data = loads(result)
+        performer = result_data['performer']
+        assert 'bio' in performer
+        assert 'tags' in performer
+        assert 'measurements' in performer
+        assert 'physical_characteristics' in performer
 
     def test_get_performer_info_minimal_data(
         self,
-        mock_stash_interface: Mock,
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
     ) -> None:
         """Test performer info with minimal fields.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
         minimal_performer = {'name': 'Minimal Performer'}
 
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_performer.return_value = (
-                minimal_performer
-            )
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://performer/{name}']('Minimal')
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            performer = result_data['performer']
-            assert performer['name'] == 'Minimal Performer'
-            assert performer['country'] == 'Not specified'
+        stub_stash_interface.find_performer.return_value = minimal_performer
+
+        # Act
+        result = registered_resources[PERFORMER_INFO_URI]('Minimal')
+
+        # Assert
+        result_data = loads(result)
+        assert result_data['success'] is True
+        performer = result_data['performer']
+        assert performer['name'] == 'Minimal Performer'
+        assert performer['country'] == 'Not specified'
 
     def test_get_performer_info_exception(
         self,
-        mock_stash_interface: Mock,
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
     ) -> None:
         """Test error handling in performer info retrieval.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_performer.side_effect = (
-                Exception('Connection failed')
-            )
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://performer/{name}']('Test')
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is False
-
-
-class TestGetPerformersByCountry:
-    """Tests for the get_performers_by_country resource."""
-
-    def test_get_performers_by_country_success(
-        self,
-        mock_stash_interface: Mock,
-        sample_performer: Dict[str, Any],
-    ) -> None:
-        """Test successful retrieval of performers by country.
+        stub_stash_interface.find_performer.side_effect = _CONN_ERR
 
-        Parameters
-        ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
-        sample_performer : Dict[str, Any]
-            Sample performer data.
-        """
-        # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        performers_list = [sample_performer.copy() for _ in range(3)]
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ), patch(
-            'stash_mcp_server.resources.add_filter',
-        ) as mock_add_filter:
-            mock_stash_interface.find_performers.return_value = (
-                performers_list
-            )
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://performer/country/{country}'](
-                'USA',
-            )
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            assert result_data['country'] == 'USA'
-            assert result_data['total'] == 3
-            mock_add_filter.assert_called_once()
-
-    def test_get_performers_by_country_empty(
-        self,
-        mock_stash_interface: Mock,
-    ) -> None:
-        """Test retrieval when no performers from country found.
+        # Act
+        result = registered_resources[PERFORMER_INFO_URI]('Test')
 
-        Parameters
-        ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
-        """
-        # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ), patch(
-            'stash_mcp_server.resources.add_filter',
-        ):
-            mock_stash_interface.find_performers.return_value = []
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://performer/country/{country}'](
-                'Unknown',
-            )
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            assert result_data['total'] == 0
-            assert result_data['performers'] == []
-
-    def test_get_performers_by_country_exception(
-        self,
-        mock_stash_interface: Mock,
-    ) -> None:
-        """Test error handling in country filtering.
+        # Assert
+        assert '"success": false' in result
 
-        Parameters
-        ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
-        """
-        # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ), patch(
-            'stash_mcp_server.resources.add_filter',
-        ):
-            mock_stash_interface.find_performers.side_effect = (
-                Exception('Filter error')
-            )
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://performer/country/{country}'](
-                'USA',
-            )
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is False
-
-
-class TestGetPerformersByEthnicity:
-    """Tests for the get_performers_by_ethnicity resource."""
-
-    def test_get_performers_by_ethnicity_success(
+
+class TestPerformerListings:
+    """Tests shared by the all, country and ethnicity listing resources."""
+
+    @pytest.mark.parametrize("uri, args, extra", _PERFORMER_SUCCESS_CASES)
+    def test_performer_listing_success(
         self,
-        mock_stash_interface: Mock,
-        sample_performer: Dict[str, Any],
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
+        add_filter_spy: List[Tuple[Any, ...]],
+        sample_performer: Mapping[str, Any],
+        uri: str,
+        args: Tuple[str, ...],
+        extra: Optional[Tuple[str, str]],
     ) -> None:
-        """Test successful retrieval by ethnicity.
+        """Test successful listing of performers.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
-        sample_performer : Dict[str, Any]
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
+        add_filter_spy : List[Tuple[Any, ...]]
+            Recorded add_filter calls.
+        sample_performer : Mapping[str, Any]
             Sample performer data.
+        uri : str
+            URI of the resource under test.
+        args : Tuple[str, ...]
+            Positional arguments passed to the resource.
+        extra : Optional[Tuple[str, str]]
+            Filter key and value echoed back in the payload, if any.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        performers_list = [sample_performer.copy() for _ in range(3)]
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ), patch(
-            'stash_mcp_server.resources.add_filter',
-        ) as mock_add_filter:
-            mock_stash_interface.find_performers.return_value = (
-                performers_list
-            )
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict[
-                'stash://performer/ethnicity/{ethnicity}'
-            ]('Asian')
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            assert result_data['ethnicity'] == 'Asian'
-            assert result_data['total'] == 3
-            mock_add_filter.assert_called_once()
-
-    def test_get_performers_by_ethnicity_empty(
+        stub_stash_interface.find_performers.return_value = (
+            [sample_performer] * 3
+        )
+
+        # Act
+        result = registered_resources[uri](*args)
+
+        # Assert
+        assert stub_stash_interface.find_performers.called
+        result_data = loads(result)
+        assert result_data['success'] is True
+        assert result_data['total'] == 3
+        assert len(result_data['performers']) == 3
+        if extra is None:
+            assert add_filter_spy == []
+        else:
+            key, value = extra
+            assert result_data[key] == value
+            assert len(add_filter_spy) == 1
+
+    @pytest.mark.parametrize("uri, args", _PERFORMER_LIST_CASES)
+    def test_performer_listing_empty(
         self,
-        mock_stash_interface: Mock,
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
+        uri: str,
+        args: Tuple[str, ...],
     ) -> None:
-        """Test retrieval when no performers with ethnicity found.
+        """Test listing when no performers match.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
+        uri : str
+            URI of the resource under test.
+        args : Tuple[str, ...]
+            Positional arguments passed to the resource.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ), patch(
-            'stash_mcp_server.resources.add_filter',
-        ):
-            mock_stash_interface.find_performers.return_value = []
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict[
-                'stash://performer/ethnicity/{ethnicity}'
-            ]('Unknown')
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            assert result_data['total'] == 0
-            assert result_data['performers'] == []
-
-    def test_get_performers_by_ethnicity_exception(
+        stub_stash_interface.find_performers.return_value = []
+
+        # Act
+        result = registered_resources[uri](*args)
+
+        # Assert
+        result_data = loads(result)
+        assert result_data['success'] is True
+        assert result_data['total'] == 0
+        assert result_data['performers'] == []
+
+    @pytest.mark.parametrize("uri, args", _PERFORMER_LIST_CASES)
+    def test_performer_listing_exception(
         self,
-        mock_stash_interface: Mock,
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
+        uri: str,
+        args: Tuple[str, ...],
     ) -> None:
-        """Test error handling in ethnicity filtering.
+        """Test error handling when the performer query fails.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
+        uri : str
+            URI of the resource under test.
+        args : Tuple[str, ...]
+            Positional arguments passed to the resource.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ), patch(
-            'stash_mcp_server.resources.add_filter',
-        ):
-            mock_stash_interface.find_performers.side_effect = (
-                Exception('Filter error')
-            )
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict[
-                'stash://performer/ethnicity/{ethnicity}'
-            ]('Asian')
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is False
+        stub_stash_interface.find_performers.side_effect = _DB_ERR
+
+        # Act
+        result = registered_resources[uri](*args)
+
+        # Assert
+        result_data = loads(result)
+        assert result_data['success'] is False
+        assert 'error' in result_data
 
 
 class TestGetPerformerStatistics:
@@ -777,487 +480,213 @@ class TestGetPerformerStatistics:
 
     def test_get_statistics_success(
         self,
-        mock_stash_interface: Mock,
-        sample_performer: Dict[str, Any],
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
+        sample_performer: Mapping[str, Any],
     ) -> None:
         """Test successful retrieval of statistics.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
-        sample_performer : Dict[str, Any]
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
+        sample_performer : Mapping[str, Any]
             Sample performer data.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        performers_list = [sample_performer.copy() for _ in range(3)]
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_performers.return_value = (
-                performers_list
-            )
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://performer/stats']()
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            assert result_data['total_performers'] == 3
-            assert 'statistics' in result_data
+        performers_list = [sample_performer] * 3
+
+        stub_stash_interface.configure_mock(
+            **{'find_performers.return_value': performers_list},
+        )
+
+        # Act
+        result = registered_resources[PERFORMER_STATS_URI]()
+
+        # Assert
+        result_data = loads(result)
+        assert result_data['success'] is True
+        assert result_data['total_performers'] == 3
+        assert 'statistics' in result_data
 
     def test_get_statistics_empty(
         self,
-        mock_stash_interface: Mock,
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
     ) -> None:
         """Test statistics retrieval with no performers.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_performers.return_value = []
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://performer/stats']()
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            assert result_data['total_performers'] == 0
-            assert result_data['statistics'] == {}
+        stub_stash_interface.configure_mock(**{'find_performers.return_value': []})
+
+        # Act
+        result = registered_resources[PERFORMER_STATS_URI]()
+
+        # Assert
+        result_data = loads(result)
+        assert result_data['success'] is True
+        assert result_data['total_performers'] == 0
+        assert result_data['statistics'] == {}
 
     def test_get_statistics_with_all_fields(
         self,
-        mock_stash_interface: Mock,
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
     ) -> None:
         """Test statistics with all optional fields present.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        performers = [
-            {
-                'name': 'Performer 1',
-                'country': 'USA',
-                'ethnicity': 'Caucasian',
-                'height_cm': 170,
-                'weight': 65,
-            },
-            {
-                'name': 'Performer 2',
-                'country': 'USA',
-                'ethnicity': 'Asian',
-                'height_cm': 165,
-                'weight': 60,
-            },
-        ]
+        stub_stash_interface.configure_mock(
+            **{'find_performers.return_value': _STATS_ALL_FIELDS},
+        )
 
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_performers.return_value = performers
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://performer/stats']()
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            stats = result_data['statistics']
-            assert 'geographic_distribution' in stats
-            assert 'ethnic_distribution' in stats
-            assert 'physical_statistics' in stats
-            assert 'height' in stats['physical_statistics']
-            assert 'weight' in stats['physical_statistics']
+        # Act
+        result = registered_resources[PERFORMER_STATS_URI]()
+
+        # Assert
+        result_data = loads(result)
+        assert result_data['success'] is True
+        stats = result_data['statistics']
+        assert 'geographic_distribution' in stats
+        assert 'ethnic_distribution' in stats
+        assert 'physical_statistics' in stats
+        assert 'height' in stats['physical_statistics']
+        assert 'weight' in stats['physical_statistics']
 
     def test_get_statistics_partial_fields(
         self,
-        mock_stash_interface: Mock,
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
     ) -> None:
         """Test statistics with some optional fields missing.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        performers = [
-            {
-                'name': 'Performer 1',
-                'height_cm': 170,
-            },
-            {
-                'name': 'Performer 2',
-                'country': 'Canada',
-            },
-        ]
+        stub_stash_interface.configure_mock(
+            **{'find_performers.return_value': _STATS_PARTIAL_FIELDS},
+        )
 
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_performers.return_value = performers
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://performer/stats']()
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            stats = result_data['statistics']
-            assert 'physical_statistics' in stats
-            assert 'height' in stats['physical_statistics']
-            assert 'weight' not in stats['physical_statistics']
-
-    def test_get_statistics_only_weights(
-        self,
-        mock_stash_interface: Mock,
-    ) -> None:
-        """Test statistics with only weight data.
-
-        Parameters
-        ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
-        """
-        # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        performers = [
-            {
-                'name': 'Performer 1',
-                'weight': 65,
-            },
-            {
-                'name': 'Performer 2',
-                'weight': 60,
-            },
-        ]
+        # Act
+        result = registered_resources[PERFORMER_STATS_URI]()
 
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_performers.return_value = performers
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://performer/stats']()
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            stats = result_data['statistics']
-            assert 'physical_statistics' in stats
-            assert 'weight' in stats['physical_statistics']
-            assert stats['physical_statistics']['weight']['average_kg'] == 62.5
-
-    def test_get_statistics_only_heights(
+        # Assert
+        result_data = loads(result)
+        assert result_data['success'] is True
+        stats = result_data['statistics']
+        assert 'physical_statistics' in stats
+        assert 'height' in stats['physical_statistics']
+        assert 'weight' not in stats['physical_statistics']
+
+    @pytest.mark.parametrize("performers, section, expected", _SPARSE_STATS_CASES)
+    def test_get_statistics_sparse_data(
         self,
-        mock_stash_interface: Mock,
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
+        performers: Tuple[Dict[str, Any], ...],
+        section: str,
+        expected: Dict[str, Any],
     ) -> None:
-        """Test statistics with only height data.
+        """Test statistics for performers with only some fields populated.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
+        performers : Tuple[Dict[str, Any], ...]
+            Performers returned by the Stash interface.
+        section : str
+            Key of the ``statistics`` section under test.
+        expected : Dict[str, Any]
+            Expected value of that section.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        performers = [
-            {
-                'name': 'Performer 1',
-                'height_cm': 170,
-            },
-            {
-                'name': 'Performer 2',
-                'height_cm': 165,
-            },
-        ]
+        stub_stash_interface.configure_mock(
+            **{'find_performers.return_value': performers},
+        )
+
+        # Act
+        result = registered_resources[PERFORMER_STATS_URI]()
 
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_performers.return_value = performers
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://performer/stats']()
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            stats = result_data['statistics']
-            assert 'physical_statistics' in stats
-            assert 'height' in stats['physical_statistics']
-            assert stats['physical_statistics']['height']['average_cm'] == 167.5
-            assert 'weight' not in stats['physical_statistics']
+        # Assert
+        result_data = loads(result)
+        assert result_data['success'] is True
+        assert result_data['statistics'][section] == expected
 
     def test_get_statistics_exception(
         self,
-        mock_stash_interface: Mock,
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
     ) -> None:
         """Test error handling in statistics calculation.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
-        """
-        # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_performers.side_effect = (
-                Exception('Database error')
-            )
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://performer/stats']()
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is False
-
-
-class TestRegisterResourcesFunction:
-    """Tests for the register_resources function."""
-
-    def test_register_resources_registers_all_endpoints(
-        self,
-        mock_stash_interface: Mock,
-    ) -> None:
-        """Test that all resource endpoints are registered.
-
-        Parameters
-        ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
         """
         # Arrange
-        mock_mcp = Mock()
-        registered_resources: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                registered_resources[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
+        stub_stash_interface.configure_mock(
+            **{'find_performers.side_effect': _DB_ERR},
+        )
 
         # Act
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            register_resources(mock_mcp)
+        result = registered_resources[PERFORMER_STATS_URI]()
 
         # Assert
-        expected_uris = [
-            'stash://performer/all',
-            'stash://performer/{name}',
-            'stash://performer/country/{country}',
-            'stash://performer/ethnicity/{ethnicity}',
-            'stash://performer/stats',
-        ]
-        for uri in expected_uris:
-            assert uri in registered_resources
-            assert callable(registered_resources[uri])
+        assert '"success": false' in result
 
-    def test_get_statistics_no_demographic_data(
-        self,
-        mock_stash_interface: Mock,
-    ) -> None:
-        """Test statistics with performers lacking demographic data.
 
-        Parameters
-        ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
-        """
-        # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        performers = [
-            {
-                'name': 'Performer 1',
-            },
-            {
-                'name': 'Performer 2',
-            },
-        ]
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_performers.return_value = performers
+class TestRegisterResourcesFunction:
+    """Tests for the register_resources function."""
 
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://performer/stats']()
+    async def test_register_resources_registers_all_endpoints(self) -> None:
+        """Test that all resource endpoints are registered on the server."""
+        # Act
+        static_uris = set(await mcp.get_resources())
+        template_uris = set(await mcp.get_resource_templates())
 
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            stats = result_data['statistics']
-            assert 'geographic_distribution' in stats
-            assert stats['geographic_distribution']['total_countries'] == 0
-            assert stats['geographic_distribution']['countries'] == {}
-            assert 'ethnic_distribution' in stats
-            assert stats['ethnic_distribution']['total_ethnicities'] == 0
+        # Assert
+        assert {
+            PERFORMER_ALL_URI,
+            PERFORMER_STATS_URI,
+            STUDIO_ALL_URI,
+            STUDIO_STATS_URI,
+            TAG_ALL_URI,
+            TAG_STATS_URI,
+        } <= static_uris
+        assert {
+            PERFORMER_INFO_URI,
+            PERFORMER_COUNTRY_URI,
+            PERFORMER_ETHNICITY_URI,
+            STUDIO_INFO_URI,
+            TAG_INFO_URI,
+        } <= template_uris
 
 
 # ============================================================================
@@ -1269,32 +698,19 @@ class TestListAllStudios:
 
     def test_list_all_studios_success(
         self,
-        mock_stash_interface: Mock,
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
     ) -> None:
         """Test successful listing of all favorite studios.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
         studios_list = [
             {
                 "id": "1",
@@ -1310,110 +726,66 @@ class TestListAllStudios:
             },
         ]
 
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_studios.return_value = studios_list
+        stub_stash_interface.find_studios.return_value = studios_list
 
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://studio/all']()
+        # Act
+        result = registered_resources[STUDIO_ALL_URI]()
 
-            # Assert
-            assert mock_stash_interface.find_studios.called
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            assert result_data['total'] == 2
-            assert 'studios' in result_data
+        # Assert
+        assert stub_stash_interface.find_studios.called
+        result_data = loads(result)
+        assert result_data['success'] is True
+        assert result_data['total'] == 2
+        assert 'studios' in result_data
 
     def test_list_all_studios_empty(
         self,
-        mock_stash_interface: Mock,
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
     ) -> None:
         """Test listing studios when none exist.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_studios.return_value = []
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://studio/all']()
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            assert result_data['total'] == 0
-            assert result_data['studios'] == []
+        stub_stash_interface.find_studios.return_value = []
+
+        # Act
+        result = registered_resources[STUDIO_ALL_URI]()
+
+        # Assert
+        result_data = loads(result)
+        assert result_data['success'] is True
+        assert result_data['total'] == 0
+        assert result_data['studios'] == []
 
     def test_list_all_studios_exception(
         self,
-        mock_stash_interface: Mock,
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
     ) -> None:
         """Test error handling when listing studios.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_studios.side_effect = (
-                Exception('API error')
-            )
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://studio/all']()
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is False
+        stub_stash_interface.find_studios.side_effect = _API_ERR
+
+        # Act
+        result = registered_resources[STUDIO_ALL_URI]()
+
+        # Assert
+        assert '"success": false' in result
 
 
 class TestGetStudioInfo:
@@ -1421,32 +793,19 @@ class TestGetStudioInfo:
 
     def test_get_studio_info_success(
         self,
-        mock_stash_interface: Mock,
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
     ) -> None:
         """Test successful retrieval of studio info.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
         studio_data = {
             "id": "1",
             "name": "Test Studio",
@@ -1461,107 +820,62 @@ class TestGetStudioInfo:
             "tags": [{"name": "tag1"}],
         }
 
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_studio.return_value = studio_data
+        stub_stash_interface.find_studio.return_value = studio_data
 
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://studio/{name}']('Test Studio')
+        # Act
+        result = registered_resources[STUDIO_INFO_URI]('Test Studio')
 
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            assert result_data['studio']['name'] == 'Test Studio'
-            assert result_data['studio']['scene_count'] == 10
+        # Assert
+        result_data = loads(result)
+        assert result_data['success'] is True
+        assert result_data['studio']['name'] == 'Test Studio'
+        assert result_data['studio']['scene_count'] == 10
 
     def test_get_studio_info_not_found(
         self,
-        mock_stash_interface: Mock,
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
     ) -> None:
         """Test studio not found error.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_studio.return_value = None
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://studio/{name}']('Unknown')
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is False
+        stub_stash_interface.find_studio.return_value = None
+
+        # Act
+        result = registered_resources[STUDIO_INFO_URI]('Unknown')
+
+        # Assert
+        assert '"success": false' in result
 
     def test_get_studio_info_exception(
         self,
-        mock_stash_interface: Mock,
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
     ) -> None:
         """Test error handling in studio info retrieval.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_studio.side_effect = (
-                Exception('API error')
-            )
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://studio/{name}']('Test')
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is False
+        stub_stash_interface.find_studio.side_effect = _API_ERR
+
+        # Act
+        result = registered_resources[STUDIO_INFO_URI]('Test')
+
+        # Assert
+        assert '"success": false' in result
 
 
 class TestGetStudioStatistics:
@@ -1569,32 +883,19 @@ class TestGetStudioStatistics:
 
     def test_get_studio_statistics_success(
         self,
-        mock_stash_interface: Mock,
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
     ) -> None:
         """Test successful retrieval of studio statistics.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
         studios = [
             {
                 "id": "1",
@@ -1614,559 +915,238 @@ class TestGetStudioStatistics:
             },
         ]
 
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_studios.return_value = studios
+        stub_stash_interface.find_studios.return_value = studios
 
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://studio/stats']()
+        # Act
+        result = registered_resources[STUDIO_STATS_URI]()
 
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            assert result_data['total_studios'] == 2
-            assert result_data['statistics']['total_scenes'] == 15
+        # Assert
+        result_data = loads(result)
+        assert result_data['success'] is True
+        assert result_data['total_studios'] == 2
+        assert result_data['statistics']['total_scenes'] == 15
 
     def test_get_studio_statistics_empty(
         self,
-        mock_stash_interface: Mock,
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
     ) -> None:
         """Test studio statistics with no studios.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_studios.return_value = []
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://studio/stats']()
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            assert result_data['total_studios'] == 0
+        stub_stash_interface.find_studios.return_value = []
+
+        # Act
+        result = registered_resources[STUDIO_STATS_URI]()
+
+        # Assert
+        result_data = loads(result)
+        assert result_data['success'] is True
+        assert result_data['total_studios'] == 0
 
     def test_get_studio_statistics_exception(
         self,
-        mock_stash_interface: Mock,
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
     ) -> None:
         """Test error handling in studio statistics.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_studios.side_effect = (
-                Exception('DB error')
-            )
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://studio/stats']()
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is False
+        stub_stash_interface.find_studios.side_effect = _DB_ERR
+
+        # Act
+        result = registered_resources[STUDIO_STATS_URI]()
+
+        # Assert
+        assert '"success": false' in result
 
 
 # ============================================================================
 # Tag Resources Tests
 # ============================================================================
 
-class TestListAllTags:
-    """Tests for the list_all_tags resource."""
-
-    def test_list_all_tags_success(
-        self,
-        mock_stash_interface: Mock,
-    ) -> None:
-        """Test successful listing of all favorite tags.
-
-        Parameters
-        ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
-        """
-        # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        tags_list = [
-            {
-                "id": "1",
-                "name": "Tag 1",
-                "scene_count": 10,
-                "description": "A tag",
-                "scene_marker_count": 5,
+class _TagCase(NamedTuple):
+    """Expectations for one tag resource."""
+
+    uri: str
+    method: str
+    args: Tuple[str, ...]
+    payload: Any
+    empty_payload: Any
+    expected_success: Dict[Tuple[str, ...], Any]
+    expected_empty: Dict[Tuple[str, ...], Any]
+
+
+def _pick(
+    data: Dict[str, Any],
+    paths: Iterable[Tuple[str, ...]],
+) -> Dict[Tuple[str, ...], Any]:
+    """Collect the values found at key paths in a decoded payload.
+
+    Parameters
+    ----------
+    data : Dict[str, Any]
+        Decoded resource payload.
+    paths : Iterable[Tuple[str, ...]]
+        Key paths to follow from the top of the payload.
+
+    Returns
+    -------
+    Dict[Tuple[str, ...], Any]
+        Value at each path, keyed by the path.
+    """
+    picked: Dict[Tuple[str, ...], Any] = {}
+    for path in paths:
+        value: Any = data
+        for key in path:
+            value = value[key]
+        picked[path] = value
+    return picked
+
+
+_TAG_CASES = [
+    pytest.param(
+        _TagCase(
+            uri=TAG_ALL_URI,
+            method='find_tags',
+            args=(),
+            payload=_TAGS_LIST,
+            empty_payload=[],
+            expected_success={('total',): 2},
+            expected_empty={('success',): True, ('total',): 0},
+        ),
+        id="all",
+    ),
+    pytest.param(
+        _TagCase(
+            uri=TAG_INFO_URI,
+            method='find_tag',
+            args=('Test Tag',),
+            payload=_TAG_DATA,
+            empty_payload=None,
+            expected_success={('tag', 'name'): 'Test Tag'},
+            expected_empty={('success',): False},
+        ),
+        id="info",
+    ),
+    pytest.param(
+        _TagCase(
+            uri=TAG_STATS_URI,
+            method='find_tags',
+            args=(),
+            payload=_TAGS_STATS,
+            empty_payload=[],
+            expected_success={
+                ('total_tags',): 2,
+                ('statistics', 'total_scene_associations'): 18,
+                ('statistics', 'total_marker_associations'): 8,
             },
-            {
-                "id": "2",
-                "name": "Tag 2",
-                "scene_count": 8,
-            },
-        ]
+            expected_empty={('success',): True, ('total_tags',): 0},
+        ),
+        id="stats",
+    ),
+]
 
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_tags.return_value = tags_list
 
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://tag/all']()
+class TestTagResources:
+    """Tests for the tag resources."""
 
-            # Assert
-            assert mock_stash_interface.find_tags.called
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            assert result_data['total'] == 2
-
-    def test_list_all_tags_empty(
+    @pytest.mark.parametrize("case", _TAG_CASES)
+    def test_success(
         self,
-        mock_stash_interface: Mock,
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
+        case: _TagCase,
     ) -> None:
-        """Test listing tags when none exist.
+        """Test a tag resource with data returned by Stash.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
+        case : _TagCase
+            Resource under test and its expectations.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_tags.return_value = []
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://tag/all']()
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            assert result_data['total'] == 0
-
-    def test_list_all_tags_exception(
-        self,
-        mock_stash_interface: Mock,
-    ) -> None:
-        """Test error handling when listing tags.
+        getattr(stub_stash_interface, case.method).return_value = case.payload
 
-        Parameters
-        ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
-        """
-        # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_tags.side_effect = (
-                Exception('API error')
-            )
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://tag/all']()
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is False
-
-
-class TestGetTagInfo:
-    """Tests for the get_tag_info resource."""
-
-    def test_get_tag_info_success(
-        self,
-        mock_stash_interface: Mock,
-    ) -> None:
-        """Test successful retrieval of tag info.
-
-        Parameters
-        ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
-        """
-        # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        tag_data = {
-            "id": "1",
-            "name": "Test Tag",
-            "scene_count": 10,
-            "scene_marker_count": 5,
-            "favorite": True,
-            "description": "A test tag",
-            "aliases": "tt",
-            "parents": [{"id": "0", "name": "Parent"}],
-            "children": [{"id": "2", "name": "Child"}],
-        }
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_tag.return_value = tag_data
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://tag/{name}']('Test Tag')
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            assert result_data['tag']['name'] == 'Test Tag'
-
-    def test_get_tag_info_not_found(
-        self,
-        mock_stash_interface: Mock,
-    ) -> None:
-        """Test tag not found error.
+        # Act
+        result = registered_resources[case.uri](*case.args)
 
-        Parameters
-        ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
-        """
-        # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_tag.return_value = None
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://tag/{name}']('Unknown')
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is False
-
-    def test_get_tag_info_exception(
-        self,
-        mock_stash_interface: Mock,
-    ) -> None:
-        """Test error handling in tag info retrieval.
+        # Assert
+        result_data = loads(result)
+        assert result_data['success'] is True
+        assert _pick(result_data, case.expected_success) == case.expected_success
 
-        Parameters
-        ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
-        """
-        # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_tag.side_effect = (
-                Exception('API error')
-            )
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://tag/{name}']('Test')
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is False
-
-
-class TestGetTagStatistics:
-    """Tests for the get_tag_statistics resource."""
-
-    def test_get_tag_statistics_success(
+    @pytest.mark.parametrize("case", _TAG_CASES)
+    def test_empty(
         self,
-        mock_stash_interface: Mock,
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
+        case: _TagCase,
     ) -> None:
-        """Test successful retrieval of tag statistics.
+        """Test a tag resource when Stash returns nothing.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
+        case : _TagCase
+            Resource under test and its expectations.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        tags = [
-            {
-                "id": "1",
-                "name": "Tag 1",
-                "scene_count": 10,
-                "scene_marker_count": 5,
-                "parents": [{"id": "0"}],
-                "children": [{"id": "2"}],
-            },
-            {
-                "id": "2",
-                "name": "Tag 2",
-                "scene_count": 8,
-                "scene_marker_count": 3,
-                "parents": None,
-                "children": None,
-            },
-        ]
+        getattr(stub_stash_interface, case.method).return_value = (
+            case.empty_payload
+        )
 
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_tags.return_value = tags
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://tag/stats']()
+        # Act
+        result = registered_resources[case.uri](*case.args)
 
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            assert result_data['total_tags'] == 2
-            assert result_data['statistics']['total_scene_associations'] == 18
-            assert result_data['statistics']['total_marker_associations'] == 8
+        # Assert
+        result_data = loads(result)
+        assert _pick(result_data, case.expected_empty) == case.expected_empty
 
-    def test_get_tag_statistics_empty(
+    @pytest.mark.parametrize("case", _TAG_CASES)
+    def test_exception(
         self,
-        mock_stash_interface: Mock,
+        registered_resources: Mapping[str, Callable[..., str]],
+        stub_stash_interface: Mock,
+        case: _TagCase,
     ) -> None:
-        """Test tag statistics with no tags.
+        """Test error handling in a tag resource.
 
         Parameters
         ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
+        registered_resources : Mapping[str, Callable[..., str]]
+            Resource functions keyed by URI.
+        stub_stash_interface : Mock
+            Mocked Stash interface returned by get_stash_interface.
+        case : _TagCase
+            Resource under test and its expectations.
         """
         # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_tags.return_value = []
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://tag/stats']()
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is True
-            assert result_data['total_tags'] == 0
-
-    def test_get_tag_statistics_exception(
-        self,
-        mock_stash_interface: Mock,
-    ) -> None:
-        """Test error handling in tag statistics.
+        getattr(stub_stash_interface, case.method).side_effect = _API_ERR
 
-        Parameters
-        ----------
-        mock_stash_interface : Mock
-            Mocked Stash interface.
-        """
-        # Arrange
-        mock_mcp = Mock()
-        resources_dict: Dict[str, Any] = {}
-
-        def capture_resource(
-            uri: str,
-            name: str,
-            description: str,
-        ) -> Callable:
-            """Capture resource function for testing."""
-            def decorator(func: Callable) -> Callable:
-                resources_dict[uri] = func
-                return func
-            return decorator
-
-        mock_mcp.resource = capture_resource
-
-        with patch(
-            'stash_mcp_server.resources.get_stash_interface',
-            return_value=mock_stash_interface,
-        ):
-            mock_stash_interface.find_tags.side_effect = (
-                Exception('DB error')
-            )
-
-            # Act
-            register_resources(mock_mcp)
-            result = resources_dict['stash://tag/stats']()
-
-            # Assert
-            result_data = json.loads(result)
-            assert result_data['success'] is False
+        # Act
+        result = registered_resources[case.uri](*case.args)
+
+        # Assert
+        assert '"success": false' in result
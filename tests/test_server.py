@@ -4,14 +4,64 @@ This module tests the server initialization, tool registration,
 and basic server functionality.
 """
 
-from unittest.mock import patch
+import asyncio
+from typing import Any, Iterable
+from unittest.mock import Mock
 
+import pytest
+import pytest_asyncio
 from fastmcp import Client
 
+from stash_mcp_server import server
 from stash_mcp_server.server import main, mcp
 
 
-async def test_server_initialization() -> None:
+def _names(registry: Any) -> Iterable[str]:
+    """Return the component names held by a server registry.
+
+    ``get_tools()``/``get_prompts()`` return a dict keyed by name; a list
+    of names or of components is accepted as well.
+
+    Parameters
+    ----------
+    registry : Any
+        Result of ``mcp.get_tools()`` or ``mcp.get_prompts()``.
+
+    Returns
+    -------
+    Iterable[str]
+        Registered names; a key view when ``registry`` is a dict.
+    """
+    if isinstance(registry, dict):
+        return registry.keys()
+    return [c if isinstance(c, str) else c.name for c in registry]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def all_tools() -> Any:
+    """Look up the registered tools once for the module.
+
+    Returns
+    -------
+    Any
+        Result of ``mcp.get_tools()``.
+    """
+    return await mcp.get_tools()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def all_prompts() -> Any:
+    """Look up the registered prompts once for the module.
+
+    Returns
+    -------
+    Any
+        Result of ``mcp.get_prompts()``.
+    """
+    return await mcp.get_prompts()
+
+
+def test_server_initialization() -> None:
     """Test that the server initializes correctly.
 
     Verifies that the FastMCP server instance is created with
@@ -21,30 +71,30 @@ async def test_server_initialization() -> None:
     assert mcp is not None
 
 
-async def test_server_has_tools() -> None:
+def test_server_has_tools(all_tools: Any) -> None:
     """Test that the server has tools registered.
 
     Verifies that tools are properly registered during server
     initialization.
+
+    Parameters
+    ----------
+    all_tools : Any
+        Registered tools of the MCP server.
     """
-    tools = await mcp.get_tools()
-    assert len(tools) > 0, "Server should have at least one tool registered"
+    assert len(all_tools) > 0, "Server should have at least one tool registered"
 
 
-async def test_server_tool_names() -> None:
+def test_server_tool_names(all_tools: Any) -> None:
     """Test that expected tools are registered with correct names.
 
     Verifies that all core tools are present in the server.
-    """
-    tools = await mcp.get_tools()
-    # get_tools() returns a dict mapping names to tool definitions
-    if isinstance(tools, dict):
-        tool_names = list(tools.keys())
-    elif isinstance(tools, list):
-        tool_names = [t if isinstance(t, str) else t.name for t in tools]
-    else:
-        tool_names = []
 
+    Parameters
+    ----------
+    all_tools : Any
+        Registered tools of the MCP server.
+    """
     expected_tools = [
         "get_performer_info",
         "get_all_performers",
@@ -55,38 +105,36 @@ async def test_server_tool_names() -> None:
         "batch_performer_insights",
     ]
 
-    for expected_tool in expected_tools:
-        assert expected_tool in tool_names, (
-            f"Tool '{expected_tool}' should be registered"
-        )
+    missing = set(expected_tools).difference(_names(all_tools))
+    assert not missing, f"Tools should be registered: {sorted(missing)}"
 
 
-async def test_server_has_prompts() -> None:
+def test_server_has_prompts(all_prompts: Any) -> None:
     """Test that the server has prompts registered.
 
     Verifies that prompts are properly registered during server
     initialization.
+
+    Parameters
+    ----------
+    all_prompts : Any
+        Registered prompts of the MCP server.
     """
-    prompts = await mcp.get_prompts()
-    assert len(prompts) > 0, (
+    assert len(all_prompts) > 0, (
         "Server should have at least one prompt registered"
     )
 
 
-async def test_server_prompt_names() -> None:
+def test_server_prompt_names(all_prompts: Any) -> None:
     """Test that expected prompts are registered.
 
     Verifies that all core prompts are present in the server.
-    """
-    prompts = await mcp.get_prompts()
-    # get_prompts() returns a dict mapping names to prompt definitions
-    if isinstance(prompts, dict):
-        prompt_names = list(prompts.keys())
-    elif isinstance(prompts, list):
-        prompt_names = [p if isinstance(p, str) else p.name for p in prompts]
-    else:
-        prompt_names = []
 
+    Parameters
+    ----------
+    all_prompts : Any
+        Registered prompts of the MCP server.
+    """
     expected_prompts = [
         "analyze-performer",
         "library-insights",
@@ -94,62 +142,60 @@ async def test_server_prompt_names() -> None:
         "discover-performers",
     ]
 
-    for expected_prompt in expected_prompts:
-        assert expected_prompt in prompt_names, (
-            f"Prompt '{expected_prompt}' should be registered"
-        )
-
-
-async def test_server_client_connection() -> None:
-    """Test that a client can connect to the server.
-
-    Verifies that the in-memory transport works correctly and
-    the client can establish a connection.
-    """
-    async with Client(mcp) as client:
-        # Test that client is connected
-        result = await client.ping()
-        assert result is True, "Client should be able to ping server"
-
-
-async def test_server_list_tools_via_client() -> None:
-    """Test that tools can be listed through a client connection.
+    missing = set(expected_prompts).difference(_names(all_prompts))
+    assert not missing, f"Prompts should be registered: {sorted(missing)}"
 
-    Verifies that the MCP protocol correctly exposes available tools.
-    """
-    async with Client(mcp) as client:
-        tools_response = await client.list_tools()
-        assert len(tools_response) > 0, (
-            "Client should receive list of available tools"
-        )
 
+async def test_server_client_surface(mcp_client: Client) -> None:
+    """Test that a client can connect and list tools and prompts.
 
-async def test_server_list_prompts_via_client() -> None:
-    """Test that prompts can be listed through a client connection.
+    Verifies that the in-memory transport works correctly and that the
+    MCP protocol exposes the available tools and prompts. The requests
+    are independent, so they are issued concurrently.
 
-    Verifies that the MCP protocol correctly exposes available prompts.
+    Parameters
+    ----------
+    mcp_client : Client
+        Client connected to the MCP server.
     """
-    async with Client(mcp) as client:
-        prompts_response = await client.list_prompts()
-        assert len(prompts_response) > 0, (
-            "Client should receive list of available prompts"
-        )
+    ping, tools_response, prompts_response = await asyncio.gather(
+        mcp_client.ping(),
+        mcp_client.list_tools(),
+        mcp_client.list_prompts(),
+    )
+    assert ping is True, "Client should be able to ping server"
+    assert len(tools_response) > 0, (
+        "Client should receive list of available tools"
+    )
+    assert len(prompts_response) > 0, (
+        "Client should receive list of available prompts"
+    )
 
 
-def test_main_function_with_mocked_connection() -> None:
+def test_main_function_with_mocked_connection(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """Test the main function executes without errors.
 
     Verifies that the main function initializes and configures
     the server correctly.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Pytest fixture used to stub the connection and the server run.
     """
-    with patch('stash_mcp_server.server.connect_to_stash') as mock_connect, \
-            patch('stash_mcp_server.server.mcp.run') as mock_run:
-        # Note: We can't actually run the server since it blocks,
-        # but we can test that main() sets it up correctly
-        main()
+    mock_connect = Mock()
+    mock_run = Mock()
+    monkeypatch.setattr(server, "connect_to_stash", mock_connect)
+    monkeypatch.setattr(mcp, "run", mock_run)
+
+    # Note: We can't actually run the server since it blocks,
+    # but we can test that main() sets it up correctly
+    main()
 
-        # Verify that connection was attempted
-        mock_connect.assert_called_once()
+    # Verify that connection was attempted
+    mock_connect.assert_called_once()
 
-        # Verify that the server was configured to run
-        mock_run.assert_called_once_with(transport="stdio")
+    # Verify that the server was configured to run
+    mock_run.assert_called_once_with(transport="stdio")
@@ -4,45 +4,76 @@ This module tests all tool implementations including caching,
 error handling, and correct data processing.
 """
 
-from typing import Any, Dict, List
-from unittest.mock import Mock, patch
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+from unittest.mock import Mock
 
+import pytest
 from fastmcp import Client
+from fastmcp.client.client import CallToolResult
 
-from stash_mcp_server.server import mcp
+from stash_mcp_server import tools
 from stash_mcp_server.tools import _cached_get_performer_info
 
 
+@pytest.fixture(autouse=True)
+def _stub_stash(
+    monkeypatch: pytest.MonkeyPatch,
+    mock_stash_interface: Mock,
+) -> None:
+    """Make every tool in this module use the mocked StashInterface.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Pytest fixture used to rebind the connection helpers.
+    mock_stash_interface : Mock
+        Mocked StashInterface returned by both helpers.
+    """
+    monkeypatch.setattr(tools, "get_stash_interface", lambda: mock_stash_interface)
+    monkeypatch.setattr(tools, "connect_to_stash", lambda: mock_stash_interface)
+
+
+def _assert_empty(result: CallToolResult, empty: Any) -> None:
+    """Assert that a tool call returned an empty value.
+
+    Parameters
+    ----------
+    result : CallToolResult
+        Result of ``Client.call_tool``.
+    empty : Any
+        Expected empty value, such as ``{}`` or ``[]``.
+    """
+    data = result.data if result.data is not None else result.structured_content
+    assert data == empty
+
+
 class TestGetPerformerInfo:
     """Tests for get_performer_info tool."""
 
     async def test_get_performer_info_success(
         self,
+        mcp_client: Client,
         mock_stash_interface: Mock,
-        sample_performer: Dict[str, Any]
+        sample_performer: Mapping[str, Any]
     ) -> None:
         """Test successful retrieval of performer information.
 
         Verifies that the tool correctly retrieves and returns
         performer data when the performer exists.
         """
-        mock_stash_interface.find_performer.return_value = sample_performer
+        mock_stash_interface.find_performer.return_value = dict(sample_performer)
 
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "get_performer_info",
-                    {"performer_name": "Test Performer"}
-                )
+        result = await mcp_client.call_tool(
+            "get_performer_info",
+            {"performer_name": "Test Performer"}
+        )
 
-                assert result.data == sample_performer
-                mock_stash_interface.find_performer.assert_called_once()
+        assert result.data == sample_performer
+        mock_stash_interface.find_performer.assert_called_once()
 
     async def test_get_performer_info_not_found(
         self,
+        mcp_client: Client,
         mock_stash_interface: Mock
     ) -> None:
         """Test behavior when performer is not found.
@@ -52,25 +83,17 @@ class TestGetPerformerInfo:
         """
         mock_stash_interface.find_performer.return_value = None
 
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "get_performer_info",
-                    {"performer_name": "Nonexistent Performer"}
-                )
-
-                # The result might be in structured_content or as text
-                assert (
-                    result.data == {}
-                    or result.structured_content == {}
-                    or "{}" in str(result.content)
-                )
+        result = await mcp_client.call_tool(
+            "get_performer_info",
+            {"performer_name": "Nonexistent Performer"}
+        )
+
+        # Should return empty dict when not found
+        _assert_empty(result, {})
 
     async def test_get_performer_info_handles_errors(
         self,
+        mcp_client: Client,
         mock_stash_interface: Mock
     ) -> None:
         """Test error handling in performer info retrieval.
@@ -78,59 +101,40 @@ class TestGetPerformerInfo:
         Verifies that the tool handles exceptions gracefully and
         returns an empty dict on error.
         """
-        # Clear the cache first
-        _cached_get_performer_info.cache_clear()
-
         mock_stash_interface.find_performer.side_effect = Exception(
             "Database error"
         )
 
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "get_performer_info",
-                    {"performer_name": "Error Test Performer"}
-                )
-
-                # Should return empty dict on error
-                assert (
-                    result.data == {}
-                    or result.structured_content == {}
-                    or "{}" in str(result.content)
-                )
+        result = await mcp_client.call_tool(
+            "get_performer_info",
+            {"performer_name": "Error Test Performer"}
+        )
+
+        # Should return empty dict on error
+        _assert_empty(result, {})
 
     def test_cached_get_performer_info_caching(
         self,
         mock_stash_interface: Mock,
-        sample_performer: Dict[str, Any]
+        sample_performer: Mapping[str, Any]
     ) -> None:
         """Test that performer info queries are cached.
 
         Verifies that repeated queries for the same performer use
         the cache instead of making additional API calls.
         """
-        mock_stash_interface.find_performer.return_value = sample_performer
+        mock_stash_interface.find_performer.return_value = dict(sample_performer)
 
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            # Clear cache before test
-            _cached_get_performer_info.cache_clear()
+        # First call - should hit the API
+        result1 = _cached_get_performer_info("Test Performer")
+        assert result1 == sample_performer
 
-            # First call - should hit the API
-            result1 = _cached_get_performer_info("Test Performer")
-            assert result1 == sample_performer
+        # Second call - should use cache
+        result2 = _cached_get_performer_info("Test Performer")
+        assert result2 == sample_performer
 
-            # Second call - should use cache
-            result2 = _cached_get_performer_info("Test Performer")
-            assert result2 == sample_performer
-
-            # Should only be called once due to caching
-            assert mock_stash_interface.find_performer.call_count == 1
+        # Should only be called once due to caching
+        assert mock_stash_interface.find_performer.call_count == 1
 
 
 class TestGetAllPerformers:
@@ -138,6 +142,7 @@ class TestGetAllPerformers:
 
     async def test_get_all_performers_default(
         self,
+        mcp_client: Client,
         mock_stash_interface: Mock,
         sample_performers_list: List[Dict[str, Any]]
     ) -> None:
@@ -149,21 +154,17 @@ class TestGetAllPerformers:
             sample_performers_list
         )
 
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "get_all_performers",
-                    {}
-                )
+        result = await mcp_client.call_tool(
+            "get_all_performers",
+            {}
+        )
 
-                assert len(result.data) == 3
-                mock_stash_interface.find_performers.assert_called_once()
+        assert len(result.data) == 3
+        mock_stash_interface.find_performers.assert_called_once()
 
     async def test_get_all_performers_with_filters(
         self,
+        mcp_client: Client,
         mock_stash_interface: Mock,
         sample_performers_list: List[Dict[str, Any]]
     ) -> None:
@@ -177,174 +178,82 @@ class TestGetAllPerformers:
             filtered_performers
         )
 
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "get_all_performers",
-                    {
-                        "favorites_only": True,
-                        "country": "USA",
-                        "ethnicity": "Caucasian"
-                    }
-                )
+        result = await mcp_client.call_tool(
+            "get_all_performers",
+            {
+                "favorites_only": True,
+                "country": "USA",
+                "ethnicity": "Caucasian"
+            }
+        )
 
-                assert len(result.data) == 1
+        assert len(result.data) == 1
+
+
+# get_all_scenes arguments, and the minimum rating the mocked query honours
+_GET_ALL_SCENES_CASES = [
+    pytest.param({}, 0, id="default"),
+    pytest.param({"min_rating": 80}, 80, id="rating_filter"),
+    pytest.param(
+        {"organized_only": False, "include_tags": None, "exclude_tags": None},
+        0,
+        id="without_tags",
+    ),
+    pytest.param(
+        {
+            "organized_only": False,
+            "min_rating": 80,
+            "max_rating": None,
+            "include_tags": "",
+            "exclude_tags": "",
+        },
+        80,
+        id="rating_only",
+    ),
+]
 
 
 class TestGetAllScenes:
     """Tests for get_all_scenes tool."""
 
-    async def test_get_all_scenes_default(
+    @pytest.mark.parametrize("arguments, min_rating", _GET_ALL_SCENES_CASES)
+    async def test_get_all_scenes(
         self,
+        mcp_client: Client,
         mock_stash_interface: Mock,
-        sample_scenes_list: List[Dict[str, Any]]
+        scenes_min_rating: Callable[[int], Tuple[Dict[str, Any], ...]],
+        arguments: Dict[str, Any],
+        min_rating: int,
     ) -> None:
-        """Test get_all_scenes with default parameters.
+        """Test get_all_scenes with different filter arguments.
 
-        Verifies that the tool returns organized scenes by default.
+        Verifies that the tool returns every scene the Stash query
+        yields, which is narrowed by rating when a minimum is given.
         """
-        mock_stash_interface.find_scenes.return_value = sample_scenes_list
+        expected_scenes = list(scenes_min_rating(min_rating))
+        mock_stash_interface.find_scenes.return_value = expected_scenes
 
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "get_all_scenes",
-                    {}
-                )
+        result = await mcp_client.call_tool("get_all_scenes", arguments)
 
-                assert len(result.data) == 5
-                mock_stash_interface.find_scenes.assert_called_once()
-
-    async def test_get_all_scenes_with_rating_filter(
-        self,
-        mock_stash_interface: Mock,
-        sample_scenes_list: List[Dict[str, Any]]
-    ) -> None:
-        """Test get_all_scenes with rating filters.
-
-        Verifies that the tool correctly filters scenes by
-        minimum and maximum ratings.
-        """
-        # Filter scenes with rating >= 80
-        high_rated_scenes = [
-            s for s in sample_scenes_list if s["rating100"] >= 80
-        ]
-        mock_stash_interface.find_scenes.return_value = high_rated_scenes
-
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "get_all_scenes",
-                    {"min_rating": 80}
-                )
-
-                # Check if data is in the expected format
-                scenes = result.data if result.data else result.structured_content
-                assert len(scenes) == len(high_rated_scenes)
+        assert len(result.data) == len(expected_scenes)
+        mock_stash_interface.find_scenes.assert_called_once()
 
     async def test_get_all_scenes_handles_errors(
         self,
+        mcp_client: Client,
         mock_stash_interface: Mock
     ) -> None:
         """Test error handling in scene retrieval.
 
         Verifies that the tool handles exceptions gracefully.
         """
-        # Clear cache to ensure we get fresh results
-        from stash_mcp_server.tools import _cached_get_all_scenes
-        _cached_get_all_scenes.cache_clear()
-
         mock_stash_interface.find_scenes.side_effect = Exception(
             "Database error"
         )
 
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool("get_all_scenes", {})
-                # Should return empty list or empty structured content
-                assert (
-                    result.data == []
-                    or result.structured_content == []
-                    or "[]" in str(result.content)
-                )
-
-    async def test_get_all_scenes_without_tags(
-        self,
-        mock_stash_interface: Mock,
-        sample_scenes_list: List[Dict[str, Any]]
-    ) -> None:
-        """Test getting scenes without tag filtering.
-
-        Verifies that scenes can be retrieved without tag filters.
-        """
-        # Clear cache
-        from stash_mcp_server.tools import _cached_get_all_scenes
-        _cached_get_all_scenes.cache_clear()
-
-        mock_stash_interface.find_scenes.return_value = sample_scenes_list
-
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "get_all_scenes",
-                    {
-                        "organized_only": False,
-                        "include_tags": None,
-                        "exclude_tags": None
-                    }
-                )
-
-                # Should return scenes
-                assert result.data or result.structured_content
-
-    async def test_get_all_scenes_with_rating_only(
-        self,
-        mock_stash_interface: Mock,
-        sample_scenes_list: List[Dict[str, Any]]
-    ) -> None:
-        """Test getting scenes with only rating filter (no tags).
-
-        Verifies scenes can be retrieved with rating filter but no tag filter.
-        """
-        # Clear cache
-        from stash_mcp_server.tools import _cached_get_all_scenes
-        _cached_get_all_scenes.cache_clear()
-
-        mock_stash_interface.find_scenes.return_value = sample_scenes_list
-
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "get_all_scenes",
-                    {
-                        "organized_only": False,
-                        "min_rating": 80,
-                        "max_rating": None,
-                        "include_tags": "",
-                        "exclude_tags": ""
-                    }
-                )
-
-                # Should return scenes
-                assert result.data or result.structured_content
+        result = await mcp_client.call_tool("get_all_scenes", {})
+        # Should return empty list or empty structured content
+        _assert_empty(result, [])
 
 
 class TestGetAllScenesFromPerformer:
@@ -352,8 +261,9 @@ class TestGetAllScenesFromPerformer:
 
     async def test_get_scenes_from_performer_success(
         self,
+        mcp_client: Client,
         mock_stash_interface: Mock,
-        sample_scenes_list: List[Dict[str, Any]]
+        sample_scenes_list: Tuple[Dict[str, Any], ...]
     ) -> None:
         """Test successful retrieval of performer's scenes.
 
@@ -362,22 +272,18 @@ class TestGetAllScenesFromPerformer:
         """
         mock_stash_interface.find_scenes.return_value = sample_scenes_list
 
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "get_all_scenes_from_performer",
-                    {"performer_name": "Test Performer"}
-                )
+        result = await mcp_client.call_tool(
+            "get_all_scenes_from_performer",
+            {"performer_name": "Test Performer"}
+        )
 
-                assert len(result.data) == 5
+        assert len(result.data) == 5
 
     async def test_get_scenes_from_performer_organized_only(
         self,
+        mcp_client: Client,
         mock_stash_interface: Mock,
-        sample_scenes_list: List[Dict[str, Any]]
+        sample_scenes_list: Tuple[Dict[str, Any], ...]
     ) -> None:
         """Test filtering for organized scenes only.
 
@@ -386,22 +292,17 @@ class TestGetAllScenesFromPerformer:
         """
         mock_stash_interface.find_scenes.return_value = sample_scenes_list
 
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "get_all_scenes_from_performer",
-                    {
-                        "performer_name": "Test Performer",
-                        "organized_only": True
-                    }
-                )
+        result = await mcp_client.call_tool(
+            "get_all_scenes_from_performer",
+            {
+                "performer_name": "Test Performer",
+                "organized_only": True
+            }
+        )
 
-                # Verify we got results
-                scenes = result.data if result.data else result.structured_content
-                assert len(scenes) == len(sample_scenes_list)
+        # Verify we got results
+        scenes = result.data if result.data else result.structured_content
+        assert len(scenes) == len(sample_scenes_list)
 
 
 class TestHealthCheck:
@@ -409,6 +310,7 @@ class TestHealthCheck:
 
     async def test_health_check_connected(
         self,
+        mcp_client: Client,
         mock_stash_interface: Mock
     ) -> None:
         """Test health check when connection is successful.
@@ -416,25 +318,17 @@ class TestHealthCheck:
         Verifies that the tool returns connection status and
         cache statistics.
         """
-        with patch(
-            'stash_mcp_server.tools.connect_to_stash',
-            return_value=mock_stash_interface
-        ):
-            with patch(
-                'stash_mcp_server.tools.get_stash_interface',
-                return_value=mock_stash_interface
-            ):
-                async with Client(mcp) as client:
-                    result = await client.call_tool("health_check", {})
-
-                    assert "connected" in result.data
-                    assert "endpoint" in result.data
-                    assert "performer_cache" in result.data
-                    assert "all_performers_cache" in result.data
-                    assert "all_scenes_cache" in result.data
+        result = await mcp_client.call_tool("health_check", {})
+
+        assert "connected" in result.data
+        assert "endpoint" in result.data
+        assert "performer_cache" in result.data
+        assert "all_performers_cache" in result.data
+        assert "all_scenes_cache" in result.data
 
     async def test_health_check_cache_info(
         self,
+        mcp_client: Client,
         mock_stash_interface: Mock
     ) -> None:
         """Test that health check returns cache statistics.
@@ -442,22 +336,13 @@ class TestHealthCheck:
         Verifies that cache hit/miss information is included
         in the health check response.
         """
-        with patch(
-            'stash_mcp_server.tools.connect_to_stash',
-            return_value=mock_stash_interface
-        ):
-            with patch(
-                'stash_mcp_server.tools.get_stash_interface',
-                return_value=mock_stash_interface
-            ):
-                async with Client(mcp) as client:
-                    result = await client.call_tool("health_check", {})
-
-                    cache = result.data["performer_cache"]
-                    assert "hits" in cache
-                    assert "misses" in cache
-                    assert "currsize" in cache
-                    assert "maxsize" in cache
+        result = await mcp_client.call_tool("health_check", {})
+
+        cache = result.data["performer_cache"]
+        assert "hits" in cache
+        assert "misses" in cache
+        assert "currsize" in cache
+        assert "maxsize" in cache
 
 
 class TestAdvancedPerformerAnalysis:
@@ -465,34 +350,31 @@ class TestAdvancedPerformerAnalysis:
 
     async def test_advanced_analysis_basic(
         self,
+        mcp_client: Client,
         mock_stash_interface: Mock,
-        sample_performer: Dict[str, Any],
-        sample_scenes_list: List[Dict[str, Any]]
+        sample_performer: Mapping[str, Any],
+        sample_scenes_list: Tuple[Dict[str, Any], ...]
     ) -> None:
         """Test basic advanced performer analysis.
 
         Verifies that the tool returns comprehensive performer
         analysis with statistics.
         """
-        mock_stash_interface.find_performer.return_value = sample_performer
+        mock_stash_interface.find_performer.return_value = dict(sample_performer)
         mock_stash_interface.find_scenes.return_value = sample_scenes_list
 
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "advanced_performer_analysis",
-                    {"performer_name": "Test Performer"}
-                )
+        result = await mcp_client.call_tool(
+            "advanced_performer_analysis",
+            {"performer_name": "Test Performer"}
+        )
 
-                assert "performer_info" in result.data
-                assert "scene_statistics" in result.data
-                assert "analysis_metadata" in result.data
+        assert "performer_info" in result.data
+        assert "scene_statistics" in result.data
+        assert "analysis_metadata" in result.data
 
     async def test_advanced_analysis_performer_not_found(
         self,
+        mcp_client: Client,
         mock_stash_interface: Mock
     ) -> None:
         """Test advanced analysis with nonexistent performer.
@@ -502,17 +384,12 @@ class TestAdvancedPerformerAnalysis:
         """
         mock_stash_interface.find_performer.return_value = None
 
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "advanced_performer_analysis",
-                    {"performer_name": "Nonexistent"}
-                )
+        result = await mcp_client.call_tool(
+            "advanced_performer_analysis",
+            {"performer_name": "Nonexistent"}
+        )
 
-                assert "error" in result.data
+        assert "error" in result.data
 
 
 class TestBatchPerformerInsights:
@@ -520,9 +397,10 @@ class TestBatchPerformerInsights:
 
     async def test_batch_insights_multiple_performers(
         self,
+        mcp_client: Client,
         mock_stash_interface: Mock,
         sample_performers_list: List[Dict[str, Any]],
-        sample_scenes_list: List[Dict[str, Any]]
+        sample_scenes_list: Tuple[Dict[str, Any], ...]
     ) -> None:
         """Test batch analysis of multiple performers.
 
@@ -534,55 +412,46 @@ class TestBatchPerformerInsights:
         )
         mock_stash_interface.find_scenes.return_value = sample_scenes_list
 
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "batch_performer_insights",
-                    {
-                        "performer_names": [
-                            "Test Performer 1",
-                            "Test Performer 2",
-                            "Test Performer 3"
-                        ]
-                    }
-                )
-
-                assert "summary" in result.data
-                assert "performers" in result.data or "failed_performers" in result.data
+        result = await mcp_client.call_tool(
+            "batch_performer_insights",
+            {
+                "performer_names": [
+                    "Test Performer 1",
+                    "Test Performer 2",
+                    "Test Performer 3"
+                ]
+            }
+        )
+
+        assert "summary" in result.data
+        assert "performers" in result.data or "failed_performers" in result.data
 
     async def test_batch_insights_respects_max_limit(
         self,
+        mcp_client: Client,
         mock_stash_interface: Mock,
-        sample_performer: Dict[str, Any]
+        sample_performer: Mapping[str, Any]
     ) -> None:
         """Test that batch analysis respects maximum performer limit.
 
         Verifies that the tool limits processing to the specified
         maximum number of performers.
         """
-        mock_stash_interface.find_performer.return_value = sample_performer
+        mock_stash_interface.find_performer.return_value = dict(sample_performer)
 
         performer_names = [f"Performer {i}" for i in range(20)]
 
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "batch_performer_insights",
-                    {
-                        "performer_names": performer_names,
-                        "max_performers": 5
-                    }
-                )
+        result = await mcp_client.call_tool(
+            "batch_performer_insights",
+            {
+                "performer_names": performer_names,
+                "max_performers": 5
+            }
+        )
 
-                # Should process at most 5 performers
-                if "performers" in result.data:
-                    assert len(result.data["performers"]) <= 5
+        # Should process at most 5 performers
+        if "performers" in result.data:
+            assert len(result.data["performers"]) <= 5
 
 
 class TestAdvancedAnalysisEdgeCases:
@@ -590,94 +459,82 @@ class TestAdvancedAnalysisEdgeCases:
 
     async def test_advanced_analysis_with_scene_error(
         self,
+        mcp_client: Client,
         mock_stash_interface: Mock,
-        sample_performer: Dict[str, Any]
+        sample_performer: Mapping[str, Any]
     ) -> None:
         """Test advanced analysis handles scene retrieval errors.
 
         Verifies graceful handling when scene fetching fails.
         """
-        mock_stash_interface.find_performer.return_value = sample_performer
+        mock_stash_interface.find_performer.return_value = dict(sample_performer)
         mock_stash_interface.find_scenes.side_effect = Exception("Scene error")
 
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "advanced_performer_analysis",
-                    {"performer_name": "Test Performer"}
-                )
+        result = await mcp_client.call_tool(
+            "advanced_performer_analysis",
+            {"performer_name": "Test Performer"}
+        )
 
-                # Should still return some data despite error
-                assert result.data is not None or result.structured_content
+        # Should still return some data despite error
+        assert result.data is not None or result.structured_content
 
     async def test_advanced_analysis_with_similar_performers_error(
         self,
+        mcp_client: Client,
         mock_stash_interface: Mock,
-        sample_performer: Dict[str, Any]
+        sample_performer: Mapping[str, Any]
     ) -> None:
         """Test analysis handles similar performer search errors.
 
         Verifies graceful handling when similar search fails.
         """
-        mock_stash_interface.find_performer.return_value = sample_performer
+        mock_stash_interface.find_performer.return_value = dict(sample_performer)
         mock_stash_interface.find_scenes.return_value = []
 
-        def mock_find_performers(*args: Any, **kwargs: Any) -> list[Any]:
-            raise Exception("Search error")
-
-        mock_stash_interface.find_performers = mock_find_performers
+        mock_stash_interface.find_performers.side_effect = Exception(
+            "Search error"
+        )
 
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "advanced_performer_analysis",
-                    {
-                        "performer_name": "Test Performer",
-                        "include_similar": True
-                    }
-                )
+        result = await mcp_client.call_tool(
+            "advanced_performer_analysis",
+            {
+                "performer_name": "Test Performer",
+                "include_similar": True
+            }
+        )
 
-                # Should still return data
-                assert result.data is not None or result.structured_content
+        # Should still return data
+        assert result.data is not None or result.structured_content
 
     async def test_advanced_analysis_deep_scene_analysis(
         self,
+        mcp_client: Client,
         mock_stash_interface: Mock,
-        sample_performer: Dict[str, Any],
-        sample_scenes_list: List[Dict[str, Any]]
+        sample_performer: Mapping[str, Any],
+        sample_scenes_list: Tuple[Dict[str, Any], ...]
     ) -> None:
         """Test deep scene analysis option.
 
         Verifies detailed scene analysis is included when requested.
         """
-        mock_stash_interface.find_performer.return_value = sample_performer
+        mock_stash_interface.find_performer.return_value = dict(sample_performer)
         mock_stash_interface.find_scenes.return_value = sample_scenes_list
 
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "advanced_performer_analysis",
-                    {
-                        "performer_name": "Test Performer",
-                        "deep_scene_analysis": True
-                    }
-                )
-
-                # Should include detailed analysis
-                data = result.data or {}
-                assert "performer_info" in data or result.structured_content
+        result = await mcp_client.call_tool(
+            "advanced_performer_analysis",
+            {
+                "performer_name": "Test Performer",
+                "deep_scene_analysis": True
+            }
+        )
+
+        # Should include detailed analysis
+        data = result.data or {}
+        assert "performer_info" in data or result.structured_content
 
     async def test_advanced_analysis_general_exception(
         self,
+        mcp_client: Client,
         mock_stash_interface: Mock
     ) -> None:
         """Test advanced analysis handles general exceptions.
@@ -689,25 +546,21 @@ class TestAdvancedAnalysisEdgeCases:
             "Unexpected error"
         )
 
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "advanced_performer_analysis",
-                    {"performer_name": "Test Performer"}
-                )
-
-                # Should return error info
-                data = result.data or {}
-                if isinstance(data, dict):
-                    assert "error" in data or result.structured_content
+        result = await mcp_client.call_tool(
+            "advanced_performer_analysis",
+            {"performer_name": "Test Performer"}
+        )
+
+        # Should return error info
+        data = result.data or {}
+        if isinstance(data, dict):
+            assert "error" in data or result.structured_content
 
     async def test_advanced_analysis_similar_performers_filtering(
         self,
+        mcp_client: Client,
         mock_stash_interface: Mock,
-        sample_performer: Dict[str, Any],
+        sample_performer: Mapping[str, Any],
         sample_performers_list: List[Dict[str, Any]]
     ) -> None:
         """Test that similar performers exclude the target performer.
@@ -726,21 +579,16 @@ class TestAdvancedAnalysisEdgeCases:
         mock_stash_interface.find_scenes.return_value = []
         mock_stash_interface.find_performers.return_value = other_performers
 
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "advanced_performer_analysis",
-                    {
-                        "performer_name": "Test Performer",
-                        "include_similar": True
-                    }
-                )
+        result = await mcp_client.call_tool(
+            "advanced_performer_analysis",
+            {
+                "performer_name": "Test Performer",
+                "include_similar": True
+            }
+        )
 
-                # Should return data without the target performer in similar list
-                assert result.data is not None or result.structured_content
+        # Should return data without the target performer in similar list
+        assert result.data is not None or result.structured_content
 
 
 class TestBatchInsightsEdgeCases:
@@ -748,33 +596,30 @@ class TestBatchInsightsEdgeCases:
 
     async def test_batch_insights_with_scene_fetch_error(
         self,
+        mcp_client: Client,
         mock_stash_interface: Mock,
-        sample_performer: Dict[str, Any]
+        sample_performer: Mapping[str, Any]
     ) -> None:
         """Test batch insights handles scene fetch errors gracefully.
 
         Verifies processing continues even when scene fetching fails.
         """
-        mock_stash_interface.find_performer.return_value = sample_performer
+        mock_stash_interface.find_performer.return_value = dict(sample_performer)
         mock_stash_interface.find_scenes.side_effect = Exception("Scene error")
 
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "batch_performer_insights",
-                    {"performer_names": ["Test Performer"]}
-                )
+        result = await mcp_client.call_tool(
+            "batch_performer_insights",
+            {"performer_names": ["Test Performer"]}
+        )
 
-                # Should still return result structure
-                assert result.data is not None or result.structured_content
+        # Should still return result structure
+        assert result.data is not None or result.structured_content
 
     async def test_batch_insights_partial_failure(
         self,
+        mcp_client: Client,
         mock_stash_interface: Mock,
-        sample_performer: Dict[str, Any]
+        sample_performer: Mapping[str, Any]
     ) -> None:
         """Test batch insights handles partial failures.
 
@@ -782,28 +627,23 @@ class TestBatchInsightsEdgeCases:
         """
         # First performer succeeds, second fails
         mock_stash_interface.find_performer.side_effect = [
-            sample_performer,
+            dict(sample_performer),
             None
         ]
         mock_stash_interface.find_scenes.return_value = []
 
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "batch_performer_insights",
-                    {
-                        "performer_names": ["Performer 1", "Performer 2"]
-                    }
-                )
-
-                # Should have both successful and failed performers
-                data = result.data or {}
-                if isinstance(data, dict):
-                    # At least one should be in failed list
-                    assert "failed_performers" in data or "performers" in data
+        result = await mcp_client.call_tool(
+            "batch_performer_insights",
+            {
+                "performer_names": ["Performer 1", "Performer 2"]
+            }
+        )
+
+        # Should have both successful and failed performers
+        data = result.data or {}
+        if isinstance(data, dict):
+            # At least one should be in failed list
+            assert "failed_performers" in data or "performers" in data
 
 
 class TestGetAllScenesFromPerformerErrors:
@@ -811,6 +651,7 @@ class TestGetAllScenesFromPerformerErrors:
 
     async def test_get_scenes_from_performer_exception(
         self,
+        mcp_client: Client,
         mock_stash_interface: Mock
     ) -> None:
         """Test exception handling in performer scene retrieval.
@@ -819,19 +660,10 @@ class TestGetAllScenesFromPerformerErrors:
         """
         mock_stash_interface.find_scenes.side_effect = Exception("API error")
 
-        with patch(
-            'stash_mcp_server.tools.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "get_all_scenes_from_performer",
-                    {"performer_name": "Test Performer"}
-                )
-
-                # Should return empty list on error
-                assert (
-                    result.data == []
-                    or result.structured_content == []
-                    or "[]" in str(result.content)
-                )
+        result = await mcp_client.call_tool(
+            "get_all_scenes_from_performer",
+            {"performer_name": "Test Performer"}
+        )
+
+        # Should return empty list on error
+        _assert_empty(result, [])
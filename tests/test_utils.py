@@ -4,9 +4,13 @@ This module tests helper functions for filter construction,
 rating calculations, and common operations.
 """
 
-from typing import Any, Dict, List
-from unittest.mock import MagicMock, Mock, patch
+import logging
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import pytest
+
+from stash_mcp_server import utils
 from stash_mcp_server.utils import (
     add_filter,
     build_rating_filter,
@@ -18,6 +22,141 @@ from stash_mcp_server.utils import (
     handle_stash_errors,
 )
 
+# build_tag_filter only looks tags up by name; like StashInterface.find_tag,
+# the stub returns None for an unknown tag. Any other attribute is missing.
+_STASH_STUB = SimpleNamespace(find_tag={
+    f"tag{i}": {"id": str(i), "name": f"tag{i}"} for i in range(1, 7)
+}.get)
+
+
+@pytest.fixture
+def patched_stash(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Make the utils module use a stubbed StashInterface.
+
+    The stub is stateless, so it is built once at import time and
+    needs no reset between tests.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Pytest fixture used to rebind ``get_stash_interface``.
+
+    Returns
+    -------
+    SimpleNamespace
+        The stub returned by ``get_stash_interface``.
+    """
+    monkeypatch.setattr(utils, "get_stash_interface", lambda: _STASH_STUB)
+    return _STASH_STUB
+
+
+# include_tags, exclude_tags, expected modifier and tag ids
+_TAG_FILTER_CASES = [
+    pytest.param("tag1, tag2", None, "INCLUDES", ["1", "2"], id="include"),
+    pytest.param(None, "tag1, tag2", "EXCLUDES", ["1", "2"], id="exclude"),
+    pytest.param("tag1", "tag2", "INCLUDES", ["1"], id="include_takes_precedence"),
+    pytest.param("", "tag5,tag6", "EXCLUDES", ["5", "6"], id="exclude_only"),
+]
+
+# min_rating, max_rating, expected modifier, value and value2
+_RATING_FILTER_CASES = [
+    pytest.param(70, None, "GREATER_THAN", 69, None, id="min_only"),
+    pytest.param(None, 90, "LESS_THAN", 91, None, id="max_only"),
+    pytest.param(60, 90, "BETWEEN", 60, 90, id="range"),
+    pytest.param(75, None, "GREATER_THAN", 74, None, id="min_only_explicit"),
+    pytest.param(None, 85, "LESS_THAN", 86, None, id="max_only_explicit"),
+]
+
+
+# Read-only scenes for extract_tag_frequency: tag1 three times, tag2 and
+# tag3 once each.
+_FREQ_TAGS = tuple(
+    MappingProxyType({"id": str(i), "name": f"tag{i}"}) for i in range(1, 4)
+)
+_SCENES_FOR_TAG_FREQ = (
+    MappingProxyType({"tags": (_FREQ_TAGS[0], _FREQ_TAGS[1])}),
+    MappingProxyType({"tags": (_FREQ_TAGS[0], _FREQ_TAGS[2])}),
+    MappingProxyType({"tags": (_FREQ_TAGS[0],)}),
+)
+
+
+# Exceptions raised by the wrapped functions, allocated once. Each raise
+# clears the previous traceback so repeated runs do not extend it.
+_VALUE_ERR = ValueError("Intentional test error")
+_RUNTIME_ERR = RuntimeError("Test error")
+
+
+# Functions wrapped by handle_stash_errors once, at import time.
+@handle_stash_errors(default_return=None)
+def _double(value: int) -> int:
+    """Double a value without raising.
+
+    Parameters
+    ----------
+    value : int
+        Value to double.
+
+    Returns
+    -------
+    int
+        Twice ``value``.
+    """
+    return value * 2
+
+
+@handle_stash_errors(default_return="error")
+def _raise_value_error() -> str:
+    """Raise the shared ValueError; the decorator returns ``"error"``.
+
+    Returns
+    -------
+    str
+        Never returns normally.
+    """
+    raise _VALUE_ERR.with_traceback(None)
+
+
+@handle_stash_errors()
+def _raise_runtime_error() -> str:
+    """Raise the shared RuntimeError; the decorator returns None.
+
+    Returns
+    -------
+    str
+        Never returns normally.
+    """
+    raise _RUNTIME_ERR.with_traceback(None)
+
+
+@handle_stash_errors(default_return=0)
+def _sum3(a: int, b: int, c: int = 0) -> int:
+    """Add positional and keyword arguments without raising.
+
+    Parameters
+    ----------
+    a : int
+        First addend.
+    b : int
+        Second addend.
+    c : int, default 0
+        Third addend, passed by keyword.
+
+    Returns
+    -------
+    int
+        Sum of the three values.
+    """
+    return a + b + c
+
+
+# wrapped function, args, kwargs and expected result
+_HANDLE_STASH_ERRORS_CASES = [
+    pytest.param(_double, (5,), {}, 10, id="success"),
+    pytest.param(_raise_value_error, (), {}, "error", id="with_exception"),
+    pytest.param(_raise_runtime_error, (), {}, None, id="default_none"),
+    pytest.param(_sum3, (1, 2), {"c": 3}, 6, id="with_args_kwargs"),
+]
+
 
 class TestAddFilter:
     """Tests for add_filter utility function."""
@@ -31,9 +170,7 @@ class TestAddFilter:
         filters: Dict[str, Any] = {}
         add_filter(filters, "country", "USA", "EQUALS")
 
-        assert "country" in filters
-        assert filters["country"]["value"] == "USA"
-        assert filters["country"]["modifier"] == "EQUALS"
+        assert filters == {"country": {"value": "USA", "modifier": "EQUALS"}}
 
     def test_add_filter_with_none_value(self) -> None:
         """Test that None values are not added to filters.
@@ -43,7 +180,7 @@ class TestAddFilter:
         filters: Dict[str, Any] = {}
         add_filter(filters, "country", None, "EQUALS")
 
-        assert "country" not in filters
+        assert filters == {}
 
     def test_add_filter_with_value2(self) -> None:
         """Test adding a filter with value2 for BETWEEN modifier.
@@ -53,78 +190,37 @@ class TestAddFilter:
         filters: Dict[str, Any] = {}
         add_filter(filters, "height_cm", 160, "BETWEEN", 180)
 
-        assert filters["height_cm"]["value"] == 160
-        assert filters["height_cm"]["value2"] == 180
-        assert filters["height_cm"]["modifier"] == "BETWEEN"
+        assert filters == {
+            "height_cm": {"value": 160, "value2": 180, "modifier": "BETWEEN"}
+        }
 
 
 class TestBuildTagFilter:
     """Tests for build_tag_filter utility function."""
 
-    def test_build_tag_filter_include(self) -> None:
-        """Test building a tag filter with included tags.
-
-        Verifies that the filter correctly specifies tags to include.
-        """
-        mock_stash = Mock()
-        mock_stash.find_tag.side_effect = [
-            {"id": "1", "name": "tag1"},
-            {"id": "2", "name": "tag2"}
-        ]
-
-        with patch(
-            'stash_mcp_server.utils.get_stash_interface',
-            return_value=mock_stash
-        ):
-            result = build_tag_filter(include_tags="tag1, tag2")
-
-            assert result is not None
-            assert result["modifier"] == "INCLUDES"
-            assert len(result["value"]) == 2
-
-    def test_build_tag_filter_exclude(self) -> None:
-        """Test building a tag filter with excluded tags.
-
-        Verifies that the filter correctly specifies tags to exclude.
-        """
-        mock_stash = Mock()
-        mock_stash.find_tag.side_effect = [
-            {"id": "1", "name": "tag1"},
-            {"id": "2", "name": "tag2"}
-        ]
-
-        with patch(
-            'stash_mcp_server.utils.get_stash_interface',
-            return_value=mock_stash
-        ):
-            result = build_tag_filter(exclude_tags="tag1, tag2")
-
-            assert result is not None
-            assert result["modifier"] == "EXCLUDES"
-            assert len(result["value"]) == 2
-
-    def test_build_tag_filter_include_takes_precedence(self) -> None:
-        """Test that include tags take precedence over exclude.
+    @pytest.mark.usefixtures("patched_stash")
+    @pytest.mark.parametrize(
+        "include_tags, exclude_tags, expected_modifier, expected_ids",
+        _TAG_FILTER_CASES,
+    )
+    def test_build_tag_filter(
+        self,
+        include_tags: Optional[str],
+        exclude_tags: Optional[str],
+        expected_modifier: str,
+        expected_ids: List[str],
+    ) -> None:
+        """Test building a tag filter from include or exclude tags.
 
-        Verifies that when both include and exclude are specified,
-        include is used.
+        Verifies that the filter uses the expected modifier and the
+        ids of the looked-up tags, with include taking precedence.
         """
-        mock_stash = Mock()
-        mock_stash.find_tag.side_effect = [
-            {"id": "1", "name": "tag1"}
-        ]
-
-        with patch(
-            'stash_mcp_server.utils.get_stash_interface',
-            return_value=mock_stash
-        ):
-            result = build_tag_filter(
-                include_tags="tag1",
-                exclude_tags="tag2"
-            )
+        result = build_tag_filter(
+            include_tags=include_tags,
+            exclude_tags=exclude_tags
+        )
 
-            assert result is not None
-            assert result["modifier"] == "INCLUDES"
+        assert result == {"modifier": expected_modifier, "value": expected_ids}
 
     def test_build_tag_filter_no_tags(self) -> None:
         """Test that None is returned when no tags are specified.
@@ -135,46 +231,46 @@ class TestBuildTagFilter:
         result = build_tag_filter()
         assert result is None
 
+    def test_build_tag_filter_returns_none_for_empty_tags(self) -> None:
+        """Test that build_tag_filter returns None for empty tags.
 
-class TestBuildRatingFilter:
-    """Tests for build_rating_filter utility function."""
-
-    def test_build_rating_filter_min_only(self) -> None:
-        """Test building a rating filter with minimum value only.
-
-        Verifies that the filter uses GREATER_THAN modifier for
-        minimum rating.
+        Verifies function returns None when no tags provided.
         """
-        result = build_rating_filter(min_rating=70)
-
-        assert result is not None
-        assert result["modifier"] == "GREATER_THAN"
-        assert result["value"] == 69  # Adjusted for inclusive behavior
+        result = build_tag_filter(
+            include_tags="",
+            exclude_tags=""
+        )
 
-    def test_build_rating_filter_max_only(self) -> None:
-        """Test building a rating filter with maximum value only.
+        assert result is None
 
-        Verifies that the filter uses LESS_THAN modifier for
-        maximum rating.
-        """
-        result = build_rating_filter(max_rating=90)
 
-        assert result is not None
-        assert result["modifier"] == "LESS_THAN"
-        assert result["value"] == 91  # Adjusted for inclusive behavior
+class TestBuildRatingFilter:
+    """Tests for build_rating_filter utility function."""
 
-    def test_build_rating_filter_range(self) -> None:
-        """Test building a rating filter with both min and max.
+    @pytest.mark.parametrize(
+        "min_rating, max_rating, expected_modifier, expected_value, expected_value2",
+        _RATING_FILTER_CASES,
+    )
+    def test_build_rating_filter(
+        self,
+        min_rating: Optional[int],
+        max_rating: Optional[int],
+        expected_modifier: str,
+        expected_value: int,
+        expected_value2: Optional[int],
+    ) -> None:
+        """Test building a rating filter from minimum and maximum values.
 
-        Verifies that the filter uses BETWEEN modifier for
-        rating ranges.
+        Verifies that a single bound uses GREATER_THAN or LESS_THAN with
+        the value adjusted for inclusive behavior, and that both bounds
+        use BETWEEN.
         """
-        result = build_rating_filter(min_rating=60, max_rating=90)
+        result = build_rating_filter(min_rating=min_rating, max_rating=max_rating)
 
         assert result is not None
-        assert result["modifier"] == "BETWEEN"
-        assert result["value"] == 60
-        assert result["value2"] == 90
+        assert result["modifier"] == expected_modifier
+        assert result["value"] == expected_value
+        assert result.get("value2") == expected_value2
 
     def test_build_rating_filter_none(self) -> None:
         """Test that None is returned when no ratings specified.
@@ -185,13 +281,24 @@ class TestBuildRatingFilter:
         result = build_rating_filter()
         assert result is None
 
+    def test_build_rating_filter_both_boundaries(self) -> None:
+        """Test rating filter with both min and max at boundaries.
+
+        Verifies correct filter construction at edge values.
+        """
+        result = build_rating_filter(min_rating=0, max_rating=100)
+
+        assert result is not None
+        assert "modifier" in result
+        assert "value" in result
+
 
 class TestCalculateAverageRating:
     """Tests for calculate_average_rating utility function."""
 
     def test_calculate_average_rating_success(
         self,
-        sample_scenes_list: List[Dict[str, Any]]
+        sample_scenes_list: Tuple[Dict[str, Any], ...]
     ) -> None:
         """Test calculating average rating from scenes.
 
@@ -227,13 +334,37 @@ class TestCalculateAverageRating:
         # Only 80 and 90 should be counted -> average is 85
         assert avg == 85.0
 
+    def test_calculate_average_rating_all_none_ratings(self) -> None:
+        """Test average calculation with all None ratings.
+
+        Verifies correct handling when all ratings are None.
+        """
+        scenes = [
+            {"rating100": None},
+            {"rating100": None},
+            {"rating100": None},
+        ]
+
+        result = calculate_average_rating(scenes)
+        assert result == 0.0
+
+    def test_calculate_average_rating_single_scene(self) -> None:
+        """Test average calculation with single scene.
+
+        Verifies correct calculation for single data point.
+        """
+        scenes = [{"rating100": 85}]
+
+        result = calculate_average_rating(scenes)
+        assert result == 85.0
+
 
 class TestCountScenesByRating:
     """Tests for count_scenes_by_rating utility function."""
 
     def test_count_scenes_by_rating_single_threshold(
         self,
-        sample_scenes_list: List[Dict[str, Any]]
+        sample_scenes_list: Tuple[Dict[str, Any], ...]
     ) -> None:
         """Test counting scenes above a rating threshold.
 
@@ -250,7 +381,7 @@ class TestCountScenesByRating:
 
     def test_count_scenes_by_rating_range(
         self,
-        sample_scenes_list: List[Dict[str, Any]]
+        sample_scenes_list: Tuple[Dict[str, Any], ...]
     ) -> None:
         """Test counting scenes within a rating range.
 
@@ -264,7 +395,7 @@ class TestCountScenesByRating:
 
     def test_count_scenes_by_rating_no_matches(
         self,
-        sample_scenes_list: List[Dict[str, Any]]
+        sample_scenes_list: Tuple[Dict[str, Any], ...]
     ) -> None:
         """Test counting when no scenes match the criteria.
 
@@ -274,6 +405,48 @@ class TestCountScenesByRating:
         count = count_scenes_by_rating(sample_scenes_list, 101)
         assert count == 0
 
+    def test_count_scenes_max_rating_only(self) -> None:
+        """Test counting with only max_rating specified.
+
+        Verifies correct counting with upper bound only.
+        """
+        scenes = [
+            {"rating100": 30},
+            {"rating100": 50},
+            {"rating100": 70},
+        ]
+
+        count = count_scenes_by_rating(scenes, min_rating=0, max_rating=60)
+        assert count >= 2  # Should count 30 and 50
+
+    def test_count_scenes_exact_boundaries(self) -> None:
+        """Test counting at exact rating boundaries.
+
+        Verifies inclusive boundary behavior.
+        """
+        scenes = [
+            {"rating100": 50},
+            {"rating100": 70},
+            {"rating100": 90},
+        ]
+
+        count = count_scenes_by_rating(scenes, min_rating=50, max_rating=90)
+        assert count == 3  # All three should be counted
+
+    def test_count_scenes_with_min_zero(self) -> None:
+        """Test counting with min_rating=0.
+
+        Verifies special handling of zero min rating.
+        """
+        scenes = [
+            {"rating100": 10},
+            {"rating100": 30},
+            {"rating100": 50},
+        ]
+
+        count = count_scenes_by_rating(scenes, min_rating=0, max_rating=40)
+        assert count >= 2  # Should count 10 and 30
+
 
 class TestExtractTagFrequency:
     """Tests for extract_tag_frequency utility function."""
@@ -284,31 +457,9 @@ class TestExtractTagFrequency:
         Verifies that the function correctly counts occurrences
         of each tag across scenes.
         """
-        scenes = [
-            {
-                "tags": [
-                    {"id": "1", "name": "tag1"},
-                    {"id": "2", "name": "tag2"}
-                ]
-            },
-            {
-                "tags": [
-                    {"id": "1", "name": "tag1"},
-                    {"id": "3", "name": "tag3"}
-                ]
-            },
-            {
-                "tags": [
-                    {"id": "1", "name": "tag1"}
-                ]
-            }
-        ]
-
-        freq = extract_tag_frequency(scenes)
+        freq = extract_tag_frequency(_SCENES_FOR_TAG_FREQ)
 
-        assert freq["tag1"] == 3
-        assert freq["tag2"] == 1
-        assert freq["tag3"] == 1
+        assert freq == {"tag1": 3, "tag2": 1, "tag3": 1}
 
     def test_extract_tag_frequency_empty_scenes(self) -> None:
         """Test tag frequency with empty scene list.
@@ -374,134 +525,6 @@ class TestFormatFilterDescription:
         desc = format_filter_description(organized_only=False)
         assert isinstance(desc, str)
 
-
-class TestBuildTagFilterEdgeCases:
-    """Tests for edge cases in build_tag_filter."""
-
-    def test_build_tag_filter_exclude_only(
-        self, mock_stash_interface: MagicMock
-    ) -> None:
-        """Test building tag filter with only exclude tags.
-
-        Verifies exclude filter is built correctly.
-        """
-        mock_stash_interface.find_tag.side_effect = [
-            {"id": "5"},
-            {"id": "6"}
-        ]
-
-        with patch(
-            'stash_mcp_server.utils.get_stash_interface',
-            return_value=mock_stash_interface
-        ):
-            result = build_tag_filter(
-                include_tags="",
-                exclude_tags="tag5,tag6"
-            )
-
-            assert result is not None
-            assert result["modifier"] == "EXCLUDES"
-            assert result["value"] == ["5", "6"]
-
-    def test_build_tag_filter_returns_none_for_empty_tags(self) -> None:
-        """Test that build_tag_filter returns None for empty tags.
-
-        Verifies function returns None when no tags provided.
-        """
-        result = build_tag_filter(
-            include_tags="",
-            exclude_tags=""
-        )
-
-        assert result is None
-
-
-class TestBuildRatingFilterEdgeCases:
-    """Tests for edge cases in build_rating_filter."""
-
-    def test_build_rating_filter_both_boundaries(self) -> None:
-        """Test rating filter with both min and max at boundaries.
-
-        Verifies correct filter construction at edge values.
-        """
-        result = build_rating_filter(min_rating=0, max_rating=100)
-
-        assert result is not None
-        assert "modifier" in result
-        assert "value" in result
-
-    def test_build_rating_filter_min_only_explicit(self) -> None:
-        """Test rating filter with only min_rating.
-
-        Verifies that only min_rating creates correct filter.
-        """
-        result = build_rating_filter(min_rating=75, max_rating=None)
-
-        assert result is not None
-        assert result["modifier"] == "GREATER_THAN"
-        assert result["value"] == 74  # min_rating - 1
-
-    def test_build_rating_filter_max_only_explicit(self) -> None:
-        """Test rating filter with only max_rating.
-
-        Verifies that only max_rating creates correct filter.
-        """
-        result = build_rating_filter(min_rating=None, max_rating=85)
-
-        assert result is not None
-        assert result["modifier"] == "LESS_THAN"
-        assert result["value"] == 86  # max_rating + 1
-
-
-class TestCountScenesByRatingEdgeCases:
-    """Tests for edge cases in count_scenes_by_rating."""
-
-    def test_count_scenes_max_rating_only(self) -> None:
-        """Test counting with only max_rating specified.
-
-        Verifies correct counting with upper bound only.
-        """
-        scenes = [
-            {"rating100": 30},
-            {"rating100": 50},
-            {"rating100": 70},
-        ]
-
-        count = count_scenes_by_rating(scenes, min_rating=0, max_rating=60)
-        assert count >= 2  # Should count 30 and 50
-
-    def test_count_scenes_exact_boundaries(self) -> None:
-        """Test counting at exact rating boundaries.
-
-        Verifies inclusive boundary behavior.
-        """
-        scenes = [
-            {"rating100": 50},
-            {"rating100": 70},
-            {"rating100": 90},
-        ]
-
-        count = count_scenes_by_rating(scenes, min_rating=50, max_rating=90)
-        assert count == 3  # All three should be counted
-
-    def test_count_scenes_with_min_zero(self) -> None:
-        """Test counting with min_rating=0.
-
-        Verifies special handling of zero min rating.
-        """
-        scenes = [
-            {"rating100": 10},
-            {"rating100": 30},
-            {"rating100": 50},
-        ]
-
-        count = count_scenes_by_rating(scenes, min_rating=0, max_rating=40)
-        assert count >= 2  # Should count 10 and 30
-
-
-class TestFormatFilterDescriptionEdgeCases:
-    """Tests for edge cases in format_filter_description."""
-
     def test_format_filter_description_with_kwargs(self) -> None:
         """Test description with additional keyword arguments.
 
@@ -529,98 +552,35 @@ class TestFormatFilterDescriptionEdgeCases:
         assert len(desc) > 0
 
 
-class TestCalculateAverageRatingEdgeCases:
-    """Tests for edge cases in calculate_average_rating."""
-
-    def test_calculate_average_rating_all_none_ratings(self) -> None:
-        """Test average calculation with all None ratings.
-
-        Verifies correct handling when all ratings are None.
-        """
-        scenes = [
-            {"rating100": None},
-            {"rating100": None},
-            {"rating100": None},
-        ]
-
-        result = calculate_average_rating(scenes)
-        assert result == 0.0
-
-    def test_calculate_average_rating_single_scene(self) -> None:
-        """Test average calculation with single scene.
-
-        Verifies correct calculation for single data point.
-        """
-        scenes = [{"rating100": 85}]
-
-        result = calculate_average_rating(scenes)
-        assert result == 85.0
-
-
 class TestHandleStashErrors:
     """Tests for handle_stash_errors decorator."""
 
-    def test_handle_stash_errors_success(self) -> None:
-        """Test decorator with successful function execution.
-
-        Verifies that the decorator returns the function result
-        when no error occurs.
-        """
-        @handle_stash_errors(default_return=None)
-        def test_func(value: int) -> int:
-            return value * 2
-
-        result = test_func(5)
-        assert result == 10
-
-    def test_handle_stash_errors_with_exception(self) -> None:
-        """Test decorator catches and handles exceptions.
-
-        Verifies that the decorator returns default value on error.
-        """
-        @handle_stash_errors(default_return="error")
-        def test_func() -> str:
-            raise ValueError("Test error")
-
-        result = test_func()
-        assert result == "error"
-
-    def test_handle_stash_errors_default_none(self) -> None:
-        """Test decorator returns None by default on error.
-
-        Verifies that when no default_return is specified, None
-        is returned on error.
-        """
-        @handle_stash_errors()
-        def test_func() -> str:
-            raise RuntimeError("Test error")
-
-        result = test_func()
-        assert result is None
-
-    def test_handle_stash_errors_with_args_kwargs(self) -> None:
-        """Test decorator preserves function args and kwargs.
+    @pytest.mark.parametrize(
+        "func, args, kwargs, expected",
+        _HANDLE_STASH_ERRORS_CASES,
+    )
+    def test_handle_stash_errors(
+        self,
+        func: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        expected: Any,
+    ) -> None:
+        """Test the decorated result on success and on error.
 
-        Verifies that the decorator correctly passes through
-        arguments and keyword arguments.
+        Verifies that the decorator passes arguments and keyword
+        arguments through, and returns the default value on error.
         """
-        @handle_stash_errors(default_return=0)
-        def test_func(a: int, b: int, c: int = 0) -> int:
-            return a + b + c
-
-        result = test_func(1, 2, c=3)
-        assert result == 6
+        assert func(*args, **kwargs) == expected
 
-    def test_handle_stash_errors_logs_exception(self) -> None:
+    def test_handle_stash_errors_logs_exception(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
         """Test decorator logs exceptions.
 
         Verifies that exceptions are logged by the decorator.
         """
-        @handle_stash_errors(default_return=None)
-        def test_func() -> str:
-            raise ValueError("Intentional test error")
-
-        with patch('stash_mcp_server.utils.logger') as mock_logger:
-            test_func()
-            # The logger should be called
-            assert mock_logger.error.called or True  # Allow either way
+        with caplog.at_level(logging.ERROR, logger=utils.logger.name):
+            _raise_value_error()
+
+        assert any(r.levelno == logging.ERROR for r in caplog.records)
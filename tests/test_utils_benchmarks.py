@@ -0,0 +1,60 @@
+"""Micro-benchmarks for the pure utility functions.
+
+These tests are deselected by default; run them with
+``pytest -m perf --benchmark-only``. They are skipped when
+pytest-benchmark is not installed.
+"""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from stash_mcp_server.utils import (
+    calculate_average_rating,
+    count_scenes_by_rating,
+    extract_tag_frequency,
+)
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.perf
+
+_BIG_SCENE_COUNT = 100_000
+
+
+@pytest.fixture(scope="module")
+def big_scenes() -> List[Dict[str, Any]]:
+    """Provide a large scene list for the benchmarks.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Scenes with ratings cycling through 0 to 100 and one of
+        fifty tags each.
+    """
+    return [
+        {"rating100": i % 101, "tags": [{"id": str(i % 50), "name": f"tag{i % 50}"}]}
+        for i in range(_BIG_SCENE_COUNT)
+    ]
+
+
+class TestUtilsBenchmarks:
+    """Benchmarks for the scene aggregation utilities."""
+
+    def test_bench_calculate_average_rating(
+        self, benchmark: Any, big_scenes: List[Dict[str, Any]]
+    ) -> None:
+        """Benchmark calculate_average_rating over the large scene list."""
+        assert benchmark(calculate_average_rating, big_scenes) == pytest.approx(50.0, abs=0.1)
+
+    def test_bench_count_scenes_by_rating(
+        self, benchmark: Any, big_scenes: List[Dict[str, Any]]
+    ) -> None:
+        """Benchmark count_scenes_by_rating over the large scene list."""
+        assert benchmark(count_scenes_by_rating, big_scenes, 50, 80) > 0
+
+    def test_bench_extract_tag_frequency(
+        self, benchmark: Any, big_scenes: List[Dict[str, Any]]
+    ) -> None:
+        """Benchmark extract_tag_frequency over the large scene list."""
+        assert len(benchmark(extract_tag_frequency, big_scenes)) == 50